@@ -3,7 +3,6 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
 from sqlmodel import SQLModel
-from app.config import settings
 from app.database import engine
 from app.models import *  # noqa: F401, F403
 
@@ -16,12 +16,14 @@ class ConnectionConfig:
         min_pool_size: Minimum number of connections in pool
         max_pool_size: Maximum number of connections in pool
         command_timeout: Timeout for commands in seconds
+        max_idle_seconds: Idle connections older than this are recycled
     """
     url: str
     name: str
     min_pool_size: int = 1
     max_pool_size: int = 5
     command_timeout: int = 60
+    max_idle_seconds: int = 300
 
 
 @dataclass
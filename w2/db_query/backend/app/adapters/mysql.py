@@ -49,6 +49,7 @@ class MySQLAdapter(DatabaseAdapter):
                 db=params['db'],
                 minsize=self.config.min_pool_size,
                 maxsize=self.config.max_pool_size,
+                pool_recycle=self.config.max_idle_seconds,
                 autocommit=True,
             )
         return self._pool
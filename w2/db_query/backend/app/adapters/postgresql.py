@@ -32,6 +32,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 min_size=self.config.min_pool_size,
                 max_size=self.config.max_pool_size,
                 command_timeout=self.config.command_timeout,
+                max_inactive_connection_lifetime=self.config.max_idle_seconds,
             )
         return self._pool
 
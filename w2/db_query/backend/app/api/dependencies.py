@@ -0,0 +1,84 @@
+"""Shared FastAPI dependencies for API endpoints."""
+
+import time
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.database import get_session
+from app.models.database import DatabaseConnection
+
+# Connection lookup cache configuration
+CONNECTION_CACHE_TTL_SECONDS = 60
+CONNECTION_CACHE_MAX_SIZE = 128
+
+# Cached connections keyed by name: (expires_at, connection)
+_connection_cache: dict[str, tuple[float, DatabaseConnection]] = {}
+
+
+def clear_connection_cache(name: str | None = None) -> None:
+    """
+    Drop cached connection lookups.
+
+    Args:
+        name: Connection name to drop, or None to drop all entries
+    """
+    if name is None:
+        _connection_cache.clear()
+    else:
+        _connection_cache.pop(name, None)
+
+
+async def get_connection(
+    name: str,
+    session: Session = Depends(get_session),
+) -> DatabaseConnection:
+    """
+    Dependency resolving a database connection by name.
+
+    Lookups are cached in-process for a short TTL so hot endpoints skip the
+    SQLite round-trip. Any insert/update/delete of a DatabaseConnection
+    invalidates its entry.
+
+    Args:
+        name: Database connection name (path parameter)
+        session: Database session
+
+    Returns:
+        DatabaseConnection detached from the session
+
+    Raises:
+        HTTPException: 404 if the connection does not exist
+    """
+    now = time.monotonic()
+    cached = _connection_cache.get(name)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    statement = select(DatabaseConnection).where(DatabaseConnection.name == name)
+    connection = session.exec(statement).first()
+
+    if not connection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Database connection '{name}' not found",
+        )
+
+    # Detach so later commits in this session do not expire the cached object
+    session.expunge(connection)
+
+    if name not in _connection_cache and len(_connection_cache) >= CONNECTION_CACHE_MAX_SIZE:
+        # Evict the oldest entry
+        _connection_cache.pop(next(iter(_connection_cache)))
+    _connection_cache[name] = (now + CONNECTION_CACHE_TTL_SECONDS, connection)
+
+    return connection
+
+
+@event.listens_for(DatabaseConnection, "after_insert")
+@event.listens_for(DatabaseConnection, "after_update")
+@event.listens_for(DatabaseConnection, "after_delete")
+def _invalidate_connection_cache(mapper, connection, target: DatabaseConnection) -> None:
+    """Invalidate the cached lookup whenever a connection row changes."""
+    clear_connection_cache(target.name)
@@ -93,6 +93,9 @@ async def create_or_update_database(
     existing = session.exec(statement).first()
 
     if existing:
+        # Drop the pool bound to the previous URL so it is rebuilt on next use
+        await database_service.close_connection(existing.db_type, name)
+
         # Update existing connection
         existing.url = input_data.url
         existing.db_type = db_type
@@ -1,9 +1,10 @@
 """Query execution API endpoints."""
 
-import json
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import Session
 from typing import List
+from app.api.dependencies import get_connection
 from app.database import get_session
 from app.models.database import DatabaseConnection
 from app.models.query import QuerySource
@@ -24,17 +25,21 @@ router = APIRouter(prefix="/api/v1/dbs", tags=["queries"])
 
 
 def to_history_entry(history) -> QueryHistoryEntry:
-    """Convert QueryHistory to QueryHistoryEntry schema."""
-    return QueryHistoryEntry(
+    """Convert QueryHistory to QueryHistoryEntry schema.
+
+    Rows come from our own SQLite table, so validation is skipped with
+    model_construct.
+    """
+    return QueryHistoryEntry.model_construct(
         id=history.id,
-        databaseName=history.database_name,
-        sqlText=history.sql_text,
-        executedAt=history.executed_at,
-        executionTimeMs=history.execution_time_ms,
-        rowCount=history.row_count,
+        database_name=history.database_name,
+        sql_text=history.sql_text,
+        executed_at=history.executed_at,
+        execution_time_ms=history.execution_time_ms,
+        row_count=history.row_count,
         success=history.success,
-        errorMessage=history.error_message,
-        querySource=history.query_source.value,
+        error_message=history.error_message,
+        query_source=history.query_source.value,
     )
 
 
@@ -42,6 +47,7 @@ def to_history_entry(history) -> QueryHistoryEntry:
 async def execute_sql_query(
     name: str,
     input_data: QueryInput,
+    connection: DatabaseConnection = Depends(get_connection),
     session: Session = Depends(get_session),
 ) -> QueryResult:
     """
@@ -50,23 +56,12 @@ async def execute_sql_query(
     Args:
         name: Database connection name
         input_data: Query input with SQL
+        connection: Resolved database connection
         session: Database session
 
     Returns:
         Query result with columns and rows
     """
-    # Get connection
-    statement = select(DatabaseConnection).where(
-        DatabaseConnection.name == name
-    )
-    connection = session.exec(statement).first()
-
-    if not connection:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Database connection '{name}' not found",
-        )
-
     # Execute query
     try:
         result = await execute_query_with_service(
@@ -94,6 +89,7 @@ async def execute_sql_query(
 async def get_query_history_for_database(
     name: str,
     limit: int = 50,
+    connection: DatabaseConnection = Depends(get_connection),
     session: Session = Depends(get_session),
 ) -> List[QueryHistoryEntry]:
     """
@@ -102,23 +98,12 @@ async def get_query_history_for_database(
     Args:
         name: Database connection name
         limit: Maximum number of queries to return
+        connection: Resolved database connection (ensures it exists)
         session: Database session
 
     Returns:
         List of query history entries
     """
-    # Verify connection exists
-    statement = select(DatabaseConnection).where(
-        DatabaseConnection.name == name
-    )
-    connection = session.exec(statement).first()
-
-    if not connection:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Database connection '{name}' not found",
-        )
-
     # Get history
     history_list = await get_query_history(session, name, limit)
     return [to_history_entry(h) for h in history_list]
@@ -128,6 +113,7 @@ async def get_query_history_for_database(
 async def natural_language_to_sql(
     name: str,
     input_data: NaturalLanguageInput,
+    connection: DatabaseConnection = Depends(get_connection),
     session: Session = Depends(get_session),
 ) -> GeneratedSqlResponse:
     """
@@ -136,21 +122,12 @@ async def natural_language_to_sql(
     Args:
         name: Database connection name
         input_data: Natural language prompt
+        connection: Resolved database connection
         session: Database session
 
     Returns:
         Generated SQL query with explanation
     """
-    # Get connection
-    statement = select(DatabaseConnection).where(DatabaseConnection.name == name)
-    connection = session.exec(statement).first()
-
-    if not connection:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Database connection '{name}' not found",
-        )
-
     # Get metadata for context
     try:
         metadata_obj = await get_cached_metadata(session, connection.name)
@@ -159,7 +136,7 @@ async def natural_language_to_sql(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Metadata not found for database '{name}'. Please refresh metadata first.",
             )
-        metadata = json.loads(metadata_obj.metadata_json)
+        metadata = orjson.loads(metadata_obj.metadata_json)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,5 +1,7 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import cached_property, lru_cache
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
@@ -11,7 +13,7 @@ class Settings(BaseSettings):
     openai_api_key: str
 
     # Data directory
-    db_query_data_dir: str = str(Path.home() / ".db_query")
+    db_query_data_dir: str = Field(default_factory=lambda: str(Path.home() / ".db_query"))
 
     # Logging
     log_level: str = "INFO"
@@ -27,6 +29,7 @@ class Settings(BaseSettings):
     db_pool_min_size: int = 1
     db_pool_max_size: int = 5
     db_pool_command_timeout: int = 60
+    db_pool_max_idle_seconds: int = 300
 
     # Metadata cache configuration
     metadata_cache_hours: int = 24
@@ -37,19 +40,27 @@ class Settings(BaseSettings):
         case_sensitive=False,
     )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins string into list."""
+        """Parse CORS origins string into list, once per settings instance."""
         if self.cors_origins == "*":
             return ["*"]
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
-    @property
+    @cached_property
     def db_path(self) -> Path:
-        """Get SQLite database path."""
+        """Get SQLite database path, creating the data directory once."""
         data_dir = Path(self.db_query_data_dir).expanduser()
         data_dir.mkdir(parents=True, exist_ok=True)
         return data_dir / "db_query.db"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings instance.
+
+    Settings are built lazily on first use and cached; use as a FastAPI
+    dependency via ``Depends(get_settings)`` and override it in tests.
+    """
+    return Settings()
@@ -1,13 +1,13 @@
 """SQLite database setup and session management."""
 
 from sqlmodel import SQLModel, create_engine, Session
-from app.config import settings
+from app.config import get_settings
 from typing import Generator
 
 
 # Create SQLite engine
 engine = create_engine(
-    f"sqlite:///{settings.db_path}",
+    f"sqlite:///{get_settings().db_path}",
     connect_args={"check_same_thread": False},  # Needed for SQLite
     echo=False,  # Set to True for SQL query logging
 )
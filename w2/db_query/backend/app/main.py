@@ -2,9 +2,11 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.config import settings
+from fastapi.responses import ORJSONResponse
+from app.config import get_settings
 from app.database import init_db
 from app.api.v1 import databases, queries
+from app.adapters.registry import adapter_registry
 from app.services.db_connection import close_all_connection_pools
 
 # Initialize database
@@ -15,12 +17,13 @@ app = FastAPI(
     title="Database Query Tool API",
     description="REST API for managing PostgreSQL database connections and executing queries",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=get_settings().cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -46,4 +49,5 @@ async def startup_event() -> None:
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Cleanup resources on shutdown."""
+    await adapter_registry.close_all_adapters()
     await close_all_connection_pools()
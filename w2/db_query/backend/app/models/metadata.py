@@ -4,6 +4,9 @@ from sqlmodel import SQLModel, Field, Column
 from sqlalchemy import Text, DateTime
 from datetime import datetime, timedelta, timezone
 
+# Metadata older than this is refreshed on next access
+_STALE_DELTA = timedelta(hours=24)
+
 
 class DatabaseMetadata(SQLModel, table=True):
     """Database metadata cache stored in SQLite."""
@@ -19,10 +22,13 @@ class DatabaseMetadata(SQLModel, table=True):
     )
     table_count: int = Field(default=0)
 
+    @property
+    def stale_after(self) -> datetime:
+        """Naive UTC time after which the metadata is considered stale."""
+        fetched_at_naive = self.fetched_at.replace(tzinfo=None) if self.fetched_at.tzinfo else self.fetched_at
+        return fetched_at_naive + _STALE_DELTA
+
     @property
     def is_stale(self) -> bool:
         """Check if metadata is stale (older than 24 hours)."""
-        # Convert both to naive UTC datetime for comparison
-        now_naive = datetime.now(timezone.utc).replace(tzinfo=None)
-        fetched_at_naive = self.fetched_at.replace(tzinfo=None) if self.fetched_at.tzinfo else self.fetched_at
-        return now_naive - fetched_at_naive > timedelta(hours=24)
+        return datetime.now(timezone.utc).replace(tzinfo=None) > self.stale_after
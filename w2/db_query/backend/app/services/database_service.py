@@ -1,9 +1,11 @@
 """High-level database service (Facade pattern)."""
 
+import asyncio
 import time
 from typing import Tuple, Optional
 import logging
 
+from app.config import get_settings
 from app.models.database import DatabaseType
 from app.adapters.base import ConnectionConfig, QueryResult, MetadataResult
 from app.adapters.registry import DatabaseAdapterRegistry, adapter_registry
@@ -37,6 +39,27 @@ class DatabaseService:
         self.registry = registry
         logger.info("Initialized DatabaseService")
 
+    @staticmethod
+    def _build_config(name: str, url: str) -> ConnectionConfig:
+        """Build connection config using the pool settings.
+
+        Args:
+            name: Connection name
+            url: Connection URL
+
+        Returns:
+            ConnectionConfig for the adapter
+        """
+        settings = get_settings()
+        return ConnectionConfig(
+            url=url,
+            name=name,
+            min_pool_size=settings.db_pool_min_size,
+            max_pool_size=settings.db_pool_max_size,
+            command_timeout=settings.db_pool_command_timeout,
+            max_idle_seconds=settings.db_pool_max_idle_seconds,
+        )
+
     async def test_connection(
         self, db_type: DatabaseType, url: str
     ) -> Tuple[bool, Optional[str]]:
@@ -91,11 +114,13 @@ class DatabaseService:
                 "SELECT * FROM users"
             )
         """
-        # Validate SQL
-        validated_sql = validate_and_transform_sql(sql, limit=limit, db_type=db_type)
+        # Validate SQL off the event loop: sqlglot parsing is CPU-bound
+        validated_sql = await asyncio.to_thread(
+            validate_and_transform_sql, sql, limit=limit, db_type=db_type
+        )
 
         # Get adapter
-        config = ConnectionConfig(url=url, name=name)
+        config = self._build_config(name, url)
         adapter = self.registry.get_adapter(db_type, config)
 
         # Execute query with timing
@@ -139,7 +164,7 @@ class DatabaseService:
                 "postgresql://..."
             )
         """
-        config = ConnectionConfig(url=url, name=name)
+        config = self._build_config(name, url)
         adapter = self.registry.get_adapter(db_type, config)
 
         logger.info(f"Extracting metadata for {name}")
@@ -1,7 +1,7 @@
 """Natural Language to SQL conversion service using OpenAI."""
 
 from openai import AsyncOpenAI
-from app.config import settings
+from app.config import get_settings
 from app.models.database import DatabaseType
 import logging
 
@@ -13,7 +13,7 @@ class NaturalLanguageToSQLService:
 
     def __init__(self):
         """Initialize OpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = AsyncOpenAI(api_key=get_settings().openai_api_key)
         self.model = "gpt-4o-mini"  # Cost-effective model for SQL generation
 
     def _build_prompt(
@@ -46,8 +46,9 @@ async def execute_query_with_service(
             limit=1000,
         )
 
-        # Convert adapter result to API schema
-        columns = [QueryColumn(**col) for col in result.columns]
+        # Convert adapter result to API schema. The adapter already produced
+        # well-typed columns/rows, so skip re-validating every row dict.
+        columns = [QueryColumn.model_construct(**col) for col in result.columns]
 
         # Save successful query to history
         await save_query_history(
@@ -61,11 +62,11 @@ async def execute_query_with_service(
             query_source,
         )
 
-        return QueryResult(
+        return QueryResult.model_construct(
             columns=columns,
             rows=result.rows,
-            rowCount=result.row_count,
-            executionTimeMs=execution_time_ms,
+            row_count=result.row_count,
+            execution_time_ms=execution_time_ms,
             sql=sql,
         )
 
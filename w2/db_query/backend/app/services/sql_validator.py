@@ -1,9 +1,20 @@
 """SQL validation service using sqlglot."""
 
+from functools import lru_cache
+
 import sqlglot
 from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.dialects.mysql import MySQL
+from sqlglot.dialects.postgres import Postgres
 from app.models.database import DatabaseType
 
+# Dialect instances resolved once instead of by name on every parse/render
+_DIALECTS: dict[DatabaseType, Dialect] = {
+    DatabaseType.POSTGRESQL: Postgres(),
+    DatabaseType.MYSQL: MySQL(),
+}
+
 
 class SqlValidationError(Exception):
     """Raised when SQL validation fails."""
@@ -11,6 +22,62 @@ class SqlValidationError(Exception):
     pass
 
 
+def _get_dialect(db_type: DatabaseType) -> Dialect:
+    """Map database type to its cached sqlglot dialect."""
+    return _DIALECTS.get(db_type, _DIALECTS[DatabaseType.MYSQL])
+
+
+@lru_cache(maxsize=512)
+def _parse(sql: str, dialect: Dialect) -> exp.Expression | None:
+    """
+    Parse SQL into a sqlglot AST, memoized on (sql, dialect).
+
+    The returned AST is shared between callers and must not be mutated;
+    call ``.copy()`` before modifying it.
+    """
+    return sqlglot.parse_one(sql, dialect=dialect)
+
+
+def _analyze(parsed: exp.Expression) -> tuple[bool, bool]:
+    """
+    Inspect the root of a parsed statement without walking the tree.
+
+    Only the outermost LIMIT matters: a LIMIT inside a subquery or CTE does
+    not bound the rows returned by the statement.
+
+    Returns:
+        Tuple of (is_select, has_limit)
+    """
+    is_select = isinstance(parsed, exp.Select)
+    return is_select, is_select and parsed.args.get("limit") is not None
+
+
+def _validate_ast(parsed: exp.Expression | None) -> tuple[bool, str | None]:
+    """Check that a parsed statement is a single SELECT."""
+    if parsed is None:
+        return False, "Failed to parse SQL query"
+
+    # Check if it's a SELECT statement
+    is_select, _ = _analyze(parsed)
+    if not is_select:
+        return False, "Only SELECT statements are allowed"
+
+    return True, None
+
+
+def _add_limit(parsed: exp.Expression, sql: str, limit: int, dialect: Dialect) -> str:
+    """Render the statement with a LIMIT clause unless it already has one."""
+    # Check if LIMIT already exists on the outer statement
+    _, has_limit = _analyze(parsed)
+    if has_limit:
+        return sql
+
+    # Add LIMIT clause to a copy so the cached AST stays untouched
+    limited = parsed.copy()
+    limited.set("limit", exp.Limit(expression=exp.Literal.number(limit)))
+    return limited.sql(dialect=dialect)
+
+
 def validate_sql(sql: str, db_type: DatabaseType = DatabaseType.POSTGRESQL) -> tuple[bool, str | None]:
     """
     Validate SQL query using sqlglot.
@@ -23,19 +90,7 @@ def validate_sql(sql: str, db_type: DatabaseType = DatabaseType.POSTGRESQL) -> t
         Tuple of (is_valid, error_message)
     """
     try:
-        # Determine dialect
-        dialect = "postgres" if db_type == DatabaseType.POSTGRESQL else "mysql"
-
-        # Parse SQL
-        parsed = sqlglot.parse_one(sql, dialect=dialect)
-        if parsed is None:
-            return False, "Failed to parse SQL query"
-
-        # Check if it's a SELECT statement
-        if not isinstance(parsed, exp.Select):
-            return False, "Only SELECT statements are allowed"
-
-        return True, None
+        return _validate_ast(_parse(sql, _get_dialect(db_type)))
     except sqlglot.errors.ParseError as e:
         return False, f"SQL parse error: {str(e)}"
     except Exception as e:
@@ -55,20 +110,12 @@ def add_limit_if_missing(sql: str, limit: int = 1000, db_type: DatabaseType = Da
         SQL query with LIMIT clause added if missing
     """
     try:
-        # Determine dialect
-        dialect = "postgres" if db_type == DatabaseType.POSTGRESQL else "mysql"
-
-        parsed = sqlglot.parse_one(sql, dialect=dialect)
+        dialect = _get_dialect(db_type)
+        parsed = _parse(sql, dialect)
         if parsed is None:
             return sql
 
-        # Check if LIMIT already exists
-        if parsed.find(exp.Limit):
-            return sql
-
-        # Add LIMIT clause
-        parsed.set("limit", exp.Limit(expression=exp.Literal.number(limit)))
-        return parsed.sql(dialect=dialect)
+        return _add_limit(parsed, sql, limit, dialect)
     except Exception:
         # If parsing fails, return original SQL
         return sql
@@ -78,6 +125,9 @@ def validate_and_transform_sql(sql: str, limit: int = 1000, db_type: DatabaseTyp
     """
     Validate SQL and add LIMIT if missing.
 
+    The statement is parsed once and the same AST is used for both
+    validation and LIMIT injection.
+
     Args:
         sql: SQL query string
         limit: Maximum number of rows to return (default: 1000)
@@ -89,8 +139,20 @@ def validate_and_transform_sql(sql: str, limit: int = 1000, db_type: DatabaseTyp
     Raises:
         SqlValidationError: If SQL validation fails
     """
-    is_valid, error_message = validate_sql(sql, db_type)
+    dialect = _get_dialect(db_type)
+    try:
+        parsed = _parse(sql, dialect)
+    except sqlglot.errors.ParseError as e:
+        raise SqlValidationError(f"SQL parse error: {str(e)}")
+    except Exception as e:
+        raise SqlValidationError(f"SQL validation error: {str(e)}")
+
+    is_valid, error_message = _validate_ast(parsed)
     if not is_valid:
         raise SqlValidationError(error_message or "Invalid SQL query")
 
-    return add_limit_if_missing(sql, limit, db_type)
+    try:
+        return _add_limit(parsed, sql, limit, dialect)
+    except Exception:
+        # If rendering fails, return original SQL
+        return sql
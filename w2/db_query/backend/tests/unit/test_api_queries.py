@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine, select
 from app.main import app
+from app.api.dependencies import clear_connection_cache
 from app.database import get_session
 from app.models.database import DatabaseConnection, ConnectionStatus
 from app.models.query import QueryHistory, QuerySource
@@ -46,6 +47,7 @@ def client(test_session):
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
+    clear_connection_cache()
 
 
 @pytest.fixture
@@ -286,6 +288,19 @@ class TestGetQueryHistory:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
 
+    def test_get_query_history_connection_cache_invalidated_on_delete(
+        self, client, sample_connection, test_session
+    ):
+        """Test that deleting a connection evicts its cached lookup."""
+        response = client.get("/api/v1/dbs/test_db/history")
+        assert response.status_code == 200
+
+        test_session.delete(test_session.merge(sample_connection))
+        test_session.commit()
+
+        response = client.get("/api/v1/dbs/test_db/history")
+        assert response.status_code == 404
+
     def test_get_query_history_includes_errors(self, client, sample_connection, test_session):
         """Test that history includes both successful and failed queries."""
         # Create successful query
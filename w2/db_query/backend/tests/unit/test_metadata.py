@@ -6,11 +6,13 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
 from sqlmodel import Session, SQLModel, create_engine, select
 from app.services.metadata import (
-    extract_postgres_metadata,
     get_cached_metadata,
     cache_metadata,
     fetch_metadata,
 )
+from app.adapters.base import ConnectionConfig, MetadataResult
+from app.adapters.postgresql import PostgreSQLAdapter
+from app.models.database import DatabaseType
 from app.models.metadata import DatabaseMetadata
 
 
@@ -99,6 +101,16 @@ def sample_metadata():
     }
 
 
+async def extract_with_pool(pool) -> dict:
+    """Run PostgreSQLAdapter.extract_metadata against a mock pool."""
+    adapter = PostgreSQLAdapter(
+        ConnectionConfig(url="postgresql://localhost/test_db", name="test_db")
+    )
+    adapter._pool = pool
+    result = await adapter.extract_metadata()
+    return result.to_dict()
+
+
 class TestExtractMetadata:
     """Test metadata extraction from PostgreSQL."""
 
@@ -163,7 +175,7 @@ class TestExtractMetadata:
             mock_row_2,  # orders count
         ]
 
-        metadata = await extract_postgres_metadata("test_db", pool)
+        metadata = await extract_with_pool(pool)
 
         assert "tables" in metadata
         assert "views" in metadata
@@ -215,7 +227,7 @@ class TestExtractMetadata:
             ],
         ]
 
-        metadata = await extract_postgres_metadata("test_db", pool)
+        metadata = await extract_with_pool(pool)
 
         assert len(metadata["views"]) == 1
         assert len(metadata["tables"]) == 0
@@ -250,7 +262,7 @@ class TestExtractMetadata:
         # Mock row count to raise error
         conn.fetchrow.side_effect = Exception("Permission denied")
 
-        metadata = await extract_postgres_metadata("test_db", pool)
+        metadata = await extract_with_pool(pool)
 
         # Should still return metadata but without row count
         assert len(metadata["tables"]) == 1
@@ -373,25 +385,27 @@ class TestFetchMetadata:
         test_session.add(cached)
         test_session.commit()
 
-        # Mock get_connection_pool to ensure it's not called
-        with patch("app.services.metadata.get_connection_pool") as mock_pool:
+        # Mock extract_metadata to ensure it's not called
+        with patch(
+            "app.services.metadata.database_service.extract_metadata",
+            new_callable=AsyncMock,
+        ) as mock_extract:
             result = await fetch_metadata(
                 test_session,
                 "test_db",
+                DatabaseType.POSTGRESQL,
                 "postgresql://localhost/test",
                 force_refresh=False,
             )
 
-            # Should not have called get_connection_pool
-            mock_pool.assert_not_called()
+            # Should not have touched the target database
+            mock_extract.assert_not_called()
 
         assert result == sample_metadata
 
     @pytest.mark.asyncio
-    async def test_fetch_metadata_refreshes_when_stale(self, test_session, sample_metadata, mock_pool):
+    async def test_fetch_metadata_refreshes_when_stale(self, test_session, sample_metadata):
         """Test that fetch refreshes when cache is stale."""
-        pool, conn = mock_pool
-
         # Create stale cache
         stale_time = (datetime.now(timezone.utc) - timedelta(hours=25)).replace(tzinfo=None)
         cached = DatabaseMetadata(
@@ -404,25 +418,27 @@ class TestFetchMetadata:
         test_session.commit()
 
         # Mock extract_metadata
-        with patch("app.services.metadata.get_connection_pool", return_value=pool):
-            with patch("app.services.metadata.extract_postgres_metadata", return_value=sample_metadata) as mock_extract:
-                result = await fetch_metadata(
-                    test_session,
-                    "test_db",
-                    "postgresql://localhost/test",
-                    force_refresh=False,
-                )
-
-                # Should have called extract_metadata
-                mock_extract.assert_called_once()
+        with patch(
+            "app.services.metadata.database_service.extract_metadata",
+            new_callable=AsyncMock,
+            return_value=MetadataResult(**sample_metadata),
+        ) as mock_extract:
+            result = await fetch_metadata(
+                test_session,
+                "test_db",
+                DatabaseType.POSTGRESQL,
+                "postgresql://localhost/test",
+                force_refresh=False,
+            )
+
+            # Should have called extract_metadata
+            mock_extract.assert_called_once()
 
         assert result == sample_metadata
 
     @pytest.mark.asyncio
-    async def test_fetch_metadata_force_refresh(self, test_session, sample_metadata, mock_pool):
+    async def test_fetch_metadata_force_refresh(self, test_session, sample_metadata):
         """Test that force_refresh bypasses cache."""
-        pool, conn = mock_pool
-
         # Create fresh cache
         cached = DatabaseMetadata(
             database_name="test_db",
@@ -434,37 +450,43 @@ class TestFetchMetadata:
         test_session.commit()
 
         # Mock extract_metadata
-        with patch("app.services.metadata.get_connection_pool", return_value=pool):
-            with patch("app.services.metadata.extract_postgres_metadata", return_value=sample_metadata) as mock_extract:
-                result = await fetch_metadata(
-                    test_session,
-                    "test_db",
-                    "postgresql://localhost/test",
-                    force_refresh=True,
-                )
-
-                # Should have called extract_metadata even with fresh cache
-                mock_extract.assert_called_once()
+        with patch(
+            "app.services.metadata.database_service.extract_metadata",
+            new_callable=AsyncMock,
+            return_value=MetadataResult(**sample_metadata),
+        ) as mock_extract:
+            result = await fetch_metadata(
+                test_session,
+                "test_db",
+                DatabaseType.POSTGRESQL,
+                "postgresql://localhost/test",
+                force_refresh=True,
+            )
+
+            # Should have called extract_metadata even with fresh cache
+            mock_extract.assert_called_once()
 
         assert result == sample_metadata
 
     @pytest.mark.asyncio
-    async def test_fetch_metadata_no_cache(self, test_session, sample_metadata, mock_pool):
+    async def test_fetch_metadata_no_cache(self, test_session, sample_metadata):
         """Test fetching metadata when no cache exists."""
-        pool, conn = mock_pool
-
         # Mock extract_metadata
-        with patch("app.services.metadata.get_connection_pool", return_value=pool):
-            with patch("app.services.metadata.extract_postgres_metadata", return_value=sample_metadata) as mock_extract:
-                result = await fetch_metadata(
-                    test_session,
-                    "test_db",
-                    "postgresql://localhost/test",
-                    force_refresh=False,
-                )
-
-                # Should have called extract_metadata
-                mock_extract.assert_called_once()
+        with patch(
+            "app.services.metadata.database_service.extract_metadata",
+            new_callable=AsyncMock,
+            return_value=MetadataResult(**sample_metadata),
+        ) as mock_extract:
+            result = await fetch_metadata(
+                test_session,
+                "test_db",
+                DatabaseType.POSTGRESQL,
+                "postgresql://localhost/test",
+                force_refresh=False,
+            )
+
+            # Should have called extract_metadata
+            mock_extract.assert_called_once()
 
         assert result == sample_metadata
 
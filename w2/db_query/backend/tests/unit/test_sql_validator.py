@@ -83,6 +83,13 @@ class TestAddLimitIfMissing:
         assert "LIMIT" in result.upper()
         assert "OFFSET" in result.upper()
 
+    def test_subquery_limit_does_not_bound_outer_query(self):
+        """Test that a LIMIT inside a subquery still gets an outer LIMIT."""
+        sql = "SELECT * FROM (SELECT * FROM users LIMIT 5) AS u"
+        result = add_limit_if_missing(sql, limit=100)
+        assert result.upper().count("LIMIT") == 2
+        assert result.rstrip().upper().endswith("LIMIT 100")
+
 
 class TestValidateAndTransformSql:
     """Test combined validation and transformation."""
@@ -105,3 +112,12 @@ class TestValidateAndTransformSql:
         result = validate_and_transform_sql(sql, limit=100)
         assert isinstance(result, str)
         assert "SELECT" in result.upper()
+
+    def test_repeated_calls_do_not_mutate_cached_ast(self):
+        """Test that LIMIT injection does not leak into the parse cache."""
+        sql = "SELECT * FROM users"
+        first = validate_and_transform_sql(sql, limit=100)
+        second = validate_and_transform_sql(sql, limit=200)
+        assert "100" in first
+        assert "200" in second
+        assert "100" not in second
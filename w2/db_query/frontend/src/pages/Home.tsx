@@ -32,6 +32,28 @@ import { NaturalLanguageInput } from "../components/NaturalLanguageInput";
 
 const { Title, Text } = Typography;
 
+// Number of rows serialized per Blob part when exporting CSV
+const CSV_CHUNK_ROWS = 1000;
+
+/** Format a single value as a CSV cell. */
+const toCsvCell = (value: unknown): string => {
+  // Handle null/undefined
+  if (value === null || value === undefined) return "";
+  // Escape quotes and wrap in quotes if contains comma or quote
+  const stringValue = String(value);
+  if (stringValue.includes(",") || stringValue.includes('"') || stringValue.includes("\n")) {
+    return `"${stringValue.replace(/"/g, '""')}"`;
+  }
+  return stringValue;
+};
+
+/** Format a value whose column type can never contain CSV special characters. */
+const toPlainCsvCell = (value: unknown): string =>
+  value === null || value === undefined ? "" : String(value);
+
+// Column data types whose values never need quoting or escaping
+const PLAIN_CSV_TYPES = new Set(["integer", "double precision", "boolean", "timestamp"]);
+
 interface QueryResult {
   columns: Array<{ name: string; dataType: string }>;
   rows: Array<Record<string, any>>;
@@ -158,27 +180,31 @@ export const Home: React.FC = () => {
   const exportToCSV = () => {
     if (!queryResult) return;
 
-    // Generate CSV content
+    // Generate CSV content in chunks so no single string holds the whole export
     const headers = queryResult.columns.map((col) => col.name);
-    const csvRows = [headers.join(",")];
+    const formatters = queryResult.columns.map((col) =>
+      PLAIN_CSV_TYPES.has(col.dataType) ? toPlainCsvCell : toCsvCell
+    );
+    const columnCount = headers.length;
+    const csvParts: string[] = [headers.join(",")];
+    let chunk: string[] = [];
 
     queryResult.rows.forEach((row) => {
-      const values = headers.map((header) => {
-        const value = row[header];
-        // Handle null/undefined
-        if (value === null || value === undefined) return "";
-        // Escape quotes and wrap in quotes if contains comma or quote
-        const stringValue = String(value);
-        if (stringValue.includes(",") || stringValue.includes('"') || stringValue.includes("\n")) {
-          return `"${stringValue.replace(/"/g, '""')}"`;
-        }
-        return stringValue;
-      });
-      csvRows.push(values.join(","));
+      const values = new Array<string>(columnCount);
+      for (let i = 0; i < columnCount; i++) {
+        values[i] = formatters[i](row[headers[i]]);
+      }
+      chunk.push(values.join(","));
+      if (chunk.length >= CSV_CHUNK_ROWS) {
+        csvParts.push("\n" + chunk.join("\n"));
+        chunk = [];
+      }
     });
+    if (chunk.length > 0) {
+      csvParts.push("\n" + chunk.join("\n"));
+    }
 
-    const csvContent = csvRows.join("\n");
-    const blob = new Blob([csvContent], { type: "text/csv;charset=utf-8;" });
+    const blob = new Blob(csvParts, { type: "text/csv;charset=utf-8;" });
     const link = document.createElement("a");
     const timestamp = new Date().toISOString().replace(/[:.]/g, "-").slice(0, -5);
     link.href = URL.createObjectURL(blob);
@@ -210,7 +236,8 @@ export const Home: React.FC = () => {
   const exportToJSON = () => {
     if (!queryResult) return;
 
-    const jsonContent = JSON.stringify(queryResult.rows, null, 2);
+    // Compact output: pretty-printing large exports doubles size and encode time
+    const jsonContent = JSON.stringify(queryResult.rows);
     const blob = new Blob([jsonContent], { type: "application/json;charset=utf-8;" });
     const link = document.createElement("a");
     const timestamp = new Date().toISOString().replace(/[:.]/g, "-").slice(0, -5);
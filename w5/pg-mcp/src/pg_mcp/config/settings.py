@@ -5,6 +5,7 @@ and type safety. Configuration is loaded from environment variables with
 sensible defaults.
 """
 
+from collections.abc import Iterable
 from typing import Literal
 
 from pydantic import Field, SecretStr, field_validator
@@ -78,15 +79,17 @@ class SecurityConfig(BaseSettings):
     allow_write_operations: bool = Field(
         default=False, description="Allow write operations (INSERT, UPDATE, DELETE)"
     )
-    blocked_functions: list[str] = Field(
-        default_factory=lambda: [
-            "pg_sleep",
-            "pg_read_file",
-            "pg_write_file",
-            "lo_import",
-            "lo_export",
-        ],
-        description="List of blocked PostgreSQL functions",
+    blocked_functions: frozenset[str] = Field(
+        default_factory=lambda: frozenset(
+            {
+                "pg_sleep",
+                "pg_read_file",
+                "pg_write_file",
+                "lo_import",
+                "lo_export",
+            }
+        ),
+        description="Set of blocked PostgreSQL functions (lowercased)",
     )
     max_rows: int = Field(default=10000, ge=1, le=100000, description="Maximum rows to return")
     max_execution_time: float = Field(
@@ -101,11 +104,11 @@ class SecurityConfig(BaseSettings):
 
     @field_validator("blocked_functions", mode="before")
     @classmethod
-    def parse_blocked_functions(cls, v: str | list[str]) -> list[str]:
-        """Parse comma-separated string or list."""
+    def parse_blocked_functions(cls, v: str | Iterable[str]) -> frozenset[str]:
+        """Parse comma-separated string or iterable into a lowercased frozenset."""
         if isinstance(v, str):
-            return [f.strip() for f in v.split(",") if f.strip()]
-        return v
+            v = v.split(",")
+        return frozenset(f.strip().lower() for f in v if f.strip())
 
 
 class ValidationConfig(BaseSettings):
@@ -105,16 +105,16 @@ async def close_pools(pools: dict[str, Pool], timeout: float = 10.0) -> None:
         try:
             # Try graceful close with timeout
             await asyncio.wait_for(pool.close(), timeout=timeout)
-            logger.info(f"Connection pool for '{db_name}' closed gracefully")
+            logger.info("Connection pool for '%s' closed gracefully", db_name)
         except asyncio.TimeoutError:
             # Force termination if graceful close times out
             logger.warning(
-                f"Graceful close timed out for '{db_name}', forcing termination"
+                "Graceful close timed out for '%s', forcing termination", db_name
             )
             pool.terminate()
-            logger.info(f"Connection pool for '{db_name}' terminated")
+            logger.info("Connection pool for '%s' terminated", db_name)
         except Exception as e:
             # Log error but continue closing other pools
-            logger.error(f"Error closing pool for '{db_name}': {e!s}")
+            logger.error("Error closing pool for '%s': %s", db_name, e)
             # Force terminate on error
             pool.terminate()
@@ -13,7 +13,7 @@ from asyncpg import Pool
 from mcp.server.fastmcp import FastMCP
 
 from pg_mcp.cache.schema_cache import SchemaCache
-from pg_mcp.config.settings import Settings
+from pg_mcp.config.settings import Settings, get_settings
 from pg_mcp.db.pool import close_pools, create_pool
 from pg_mcp.models.query import QueryRequest, QueryResponse, ReturnType
 from pg_mcp.observability.logging import configure_logging, get_logger
@@ -76,7 +76,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
     try:
         # 1. Load Settings
         logger.info("Loading configuration...")
-        _settings = Settings()
+        _settings = get_settings()
 
         # 2. Configure logging
         logger.info("Configuring logging...")
@@ -101,7 +101,8 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         pool = await create_pool(_settings.database)
         _pools[_settings.database.name] = pool
         logger.info(
-            f"Created connection pool for database '{_settings.database.name}'",
+            "Created connection pool for database '%s'",
+            _settings.database.name,
             extra={
                 "min_size": _settings.database.min_pool_size,
                 "max_size": _settings.database.max_pool_size,
@@ -113,10 +114,11 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         _schema_cache = SchemaCache(_settings.cache)
 
         for db_name, pool in _pools.items():
-            logger.info(f"Loading schema for database '{db_name}'...")
+            logger.info("Loading schema for database '%s'...", db_name)
             schema = await _schema_cache.load(db_name, pool)
             logger.info(
-                f"Schema loaded for '{db_name}'",
+                "Schema loaded for '%s'",
+                db_name,
                 extra={
                     "tables": len(schema.tables),
                 },
@@ -141,7 +143,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             from prometheus_client import start_http_server
 
             start_http_server(_settings.observability.metrics_port)
-            logger.info(f"Metrics server started on port {_settings.observability.metrics_port}")
+            logger.info("Metrics server started on port %d", _settings.observability.metrics_port)
 
         # 6. Create service components
         logger.info("Initializing service components...")
@@ -166,7 +168,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
                 db_config=_settings.database,
             )
             sql_executors[db_name] = executor
-            logger.info(f"Created SQL executor for database '{db_name}'")
+            logger.info("Created SQL executor for database '%s'", db_name)
 
         # Result Validator
         result_validator = ResultValidator(
@@ -231,7 +233,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             except asyncio.TimeoutError:
                 logger.warning("Schema auto-refresh stop timed out")
             except Exception as e:
-                logger.warning(f"Error stopping schema auto-refresh: {e!s}")
+                logger.warning("Error stopping schema auto-refresh: %s", e)
 
         # Close database connection pools with timeout
         if _pools is not None:
@@ -240,7 +242,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
                 await close_pools(_pools, timeout=5.0)
                 logger.info("Database connection pools closed")
             except Exception as e:
-                logger.error(f"Error closing connection pools: {e!s}")
+                logger.error("Error closing connection pools: %s", e)
 
         logger.info("PostgreSQL MCP Server shutdown complete")
 
@@ -373,17 +373,20 @@ class QueryOrchestrator:
         error_feedback: str | None = None
         max_retries = self.resilience_config.max_retries
         tokens_used: int | None = None
+        # Skip building per-attempt debug payloads when DEBUG is filtered out
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for attempt in range(max_retries + 1):
             try:
-                logger.debug(
-                    "Generating SQL",
-                    extra={
-                        "request_id": request_id,
-                        "attempt": attempt + 1,
-                        "max_retries": max_retries + 1,
-                    },
-                )
+                if debug_enabled:
+                    logger.debug(
+                        "Generating SQL",
+                        extra={
+                            "request_id": request_id,
+                            "attempt": attempt + 1,
+                            "max_retries": max_retries + 1,
+                        },
+                    )
 
                 # Generate SQL
                 generated_sql = await self.sql_generator.generate(
@@ -396,13 +399,14 @@ class QueryOrchestrator:
                 # Note: tokens_used would come from OpenAI response metadata if available
                 # For now, we don't extract it, but it can be added later
 
-                logger.debug(
-                    "SQL generated",
-                    extra={
-                        "request_id": request_id,
-                        "sql_length": len(generated_sql),
-                    },
-                )
+                if debug_enabled:
+                    logger.debug(
+                        "SQL generated",
+                        extra={
+                            "request_id": request_id,
+                            "sql_length": len(generated_sql),
+                        },
+                    )
 
                 # Validate SQL
                 try:
@@ -8,6 +8,7 @@ import asyncio
 import datetime
 import decimal
 import uuid
+from collections.abc import Callable
 from typing import Any
 
 import asyncpg
@@ -16,6 +17,20 @@ from asyncpg import Connection, Pool
 from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
 from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
 
+# Converters for non-JSON-native scalar types, keyed by exact type. Order in
+# the base list matters: datetime must be checked before its parent date.
+_SCALAR_SERIALIZERS_BY_BASE: tuple[tuple[type, Callable[[Any], Any]], ...] = (
+    (datetime.datetime, datetime.datetime.isoformat),
+    (datetime.date, datetime.date.isoformat),
+    (datetime.time, datetime.time.isoformat),
+    (datetime.timedelta, str),
+    (decimal.Decimal, float),
+    (uuid.UUID, str),
+    (bytes, bytes.hex),
+)
+_SCALAR_SERIALIZERS: dict[type, Callable[[Any], Any]] = dict(_SCALAR_SERIALIZERS_BY_BASE)
+_PASSTHROUGH_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
 
 class SQLExecutor:
     """SQL executor using asyncpg with security measures.
@@ -249,29 +264,16 @@ class SQLExecutor:
             Returns:
                 Serialized value that is JSON-compatible.
             """
-            # Handle None
-            if value is None:
-                return None
-
-            # Handle datetime types
-            if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
-                return value.isoformat()
-
-            # Handle timedelta
-            if isinstance(value, datetime.timedelta):
-                return str(value)
+            value_type = type(value)
 
-            # Handle Decimal (convert to float)
-            if isinstance(value, decimal.Decimal):
-                return float(value)
+            # Fast path: JSON-native scalars and None are returned as-is
+            if value_type in _PASSTHROUGH_TYPES:
+                return value
 
-            # Handle UUID
-            if isinstance(value, uuid.UUID):
-                return str(value)
-
-            # Handle bytes (convert to hex string)
-            if isinstance(value, bytes):
-                return value.hex()
+            # Exact-type dispatch for datetime, Decimal, UUID, bytes, etc.
+            convert = _SCALAR_SERIALIZERS.get(value_type)
+            if convert is not None:
+                return convert(value)
 
             # Handle lists and tuples (recursively serialize)
             if isinstance(value, (list, tuple)):
@@ -281,7 +283,14 @@ class SQLExecutor:
             if isinstance(value, dict):
                 return {k: serialize_value(v) for k, v in value.items()}
 
-            # Return other types as-is (str, int, float, bool, etc.)
+            # Subclasses of handled types (e.g. asyncpg's UUID): resolve once
+            # via isinstance and remember the converter for that exact type
+            for base, convert in _SCALAR_SERIALIZERS_BY_BASE:
+                if isinstance(value, base):
+                    _SCALAR_SERIALIZERS[value_type] = convert
+                    return convert(value)
+
+            # Return other types as-is (str subclasses, custom objects, etc.)
             return value
 
         # Serialize all values in all rows
@@ -18,6 +18,10 @@ if TYPE_CHECKING:
 
     from pg_mcp.models.schema import DatabaseSchema
 
+# SQL extraction patterns, compiled once at import
+_CODE_BLOCK_RE = re.compile(r"```(?:sql)?\s*\n?(.*?)\n?```", re.DOTALL | re.IGNORECASE)
+_PLAIN_SQL_RE = re.compile(r"((?:WITH|SELECT)\s+.*?)(?:;|$)", re.DOTALL | re.IGNORECASE)
+
 
 class SQLGenerator:
     """SQL generator using OpenAI for natural language to SQL conversion.
@@ -35,14 +39,18 @@ class SQLGenerator:
         ... )
     """
 
-    def __init__(self, config: OpenAIConfig) -> None:
+    def __init__(self, config: OpenAIConfig, client: AsyncOpenAI | None = None) -> None:
         """Initialize SQL generator with OpenAI configuration.
 
         Args:
             config: OpenAI configuration including API key and model settings.
+            client: Optional pre-built OpenAI client. When omitted, a client is
+                created from ``config``.
         """
         self.config = config
-        self.client = AsyncOpenAI(api_key=config.api_key.get_secret_value(), timeout=config.timeout)
+        self.client = client or AsyncOpenAI(
+            api_key=config.api_key.get_secret_value(), timeout=config.timeout
+        )
 
     async def generate(
         self,
@@ -180,20 +188,18 @@ class SQLGenerator:
         content = content.strip()
 
         # Strategy 1: Match ```sql ... ``` or ``` ... ``` code blocks
-        code_block_pattern = r"```(?:sql)?\s*\n?(.*?)\n?```"
-        matches = re.findall(code_block_pattern, content, re.DOTALL | re.IGNORECASE)
+        match = _CODE_BLOCK_RE.search(content)
 
-        if matches:
-            sql = matches[0].strip()
+        if match:
+            sql = match.group(1).strip()
             # Remove trailing semicolon for consistency
             return sql.rstrip(";") + ";"
 
         # Strategy 2: Find SELECT/WITH statements in plain text
-        sql_pattern = r"((?:WITH|SELECT)\s+.*?)(?:;|$)"
-        matches = re.findall(sql_pattern, content, re.DOTALL | re.IGNORECASE)
+        match = _PLAIN_SQL_RE.search(content)
 
-        if matches:
-            sql = matches[0].strip()
+        if match:
+            sql = match.group(1).strip()
             return sql.rstrip(";") + ";"
 
         # Strategy 3: Check if entire content looks like SQL
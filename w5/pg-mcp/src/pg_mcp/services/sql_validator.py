@@ -5,6 +5,8 @@ It ensures that only safe, read-only queries are executed and blocks potentially
 dangerous operations.
 """
 
+import re
+from functools import lru_cache
 from typing import ClassVar
 
 import sqlglot
@@ -13,6 +15,62 @@ from sqlglot import exp
 from pg_mcp.config.settings import SecurityConfig
 from pg_mcp.models.errors import SecurityViolationError, SQLParseError
 
+_KEYWORD_RE = re.compile(r"[A-Za-z_]+")
+
+# Statements rejected from their first keyword without parsing
+_WRITE_KEYWORDS = frozenset(
+    {
+        "INSERT",
+        "UPDATE",
+        "DELETE",
+        "DROP",
+        "TRUNCATE",
+        "ALTER",
+        "CREATE",
+        "GRANT",
+        "REVOKE",
+        "MERGE",
+        "COPY",
+    }
+)
+
+
+def _leading_keyword(sql: str) -> str | None:
+    """Return the first keyword of a statement, skipping whitespace and comments.
+
+    Scans left to right in linear time, so untrusted input cannot make it
+    backtrack. Returns None if the SQL does not start with a keyword, e.g. it
+    opens with a parenthesis or an unterminated comment.
+    """
+    pos, end = 0, len(sql)
+    while pos < end:
+        if sql[pos].isspace():
+            pos += 1
+        elif sql.startswith("--", pos):
+            newline = sql.find("\n", pos + 2)
+            if newline == -1:
+                return None
+            pos = newline + 1
+        elif sql.startswith("/*", pos):
+            close = sql.find("*/", pos + 2)
+            if close == -1:
+                return None
+            pos = close + 2
+        else:
+            break
+    match = _KEYWORD_RE.match(sql, pos)
+    return match.group(0) if match else None
+
+
+@lru_cache(maxsize=1024)
+def _parse_postgres(sql: str) -> tuple[exp.Expression | None, ...]:
+    """Parse SQL with the PostgreSQL dialect, memoized on the raw SQL string.
+
+    The returned ASTs are shared between callers and must be treated as
+    read-only. Parse errors propagate and are not cached.
+    """
+    return tuple(sqlglot.parse(sql, read="postgres"))
+
 
 class SQLValidator:
     """SQL security validator using SQLGlot for parsing and validation.
@@ -26,13 +84,16 @@ class SQLValidator:
     """
 
     # Allowed statement types at the top level (including set operations)
-    ALLOWED_STATEMENT_TYPES: ClassVar = {
-        exp.Select, exp.Union, exp.Intersect, exp.Except
-    }
+    ALLOWED_STATEMENT_TYPES: ClassVar = {exp.Select, exp.Union, exp.Intersect, exp.Except}
 
     # Allowed top-level expressions (including CTEs)
     ALLOWED_TOP_LEVEL: ClassVar = {
-        exp.Select, exp.Union, exp.Intersect, exp.Except, exp.With, exp.Subquery
+        exp.Select,
+        exp.Union,
+        exp.Intersect,
+        exp.Except,
+        exp.With,
+        exp.Subquery,
     }
 
     # Forbidden statement types
@@ -52,27 +113,29 @@ class SQLValidator:
     }
 
     # Built-in dangerous PostgreSQL functions
-    BUILTIN_DANGEROUS_FUNCTIONS: ClassVar = {
-        "pg_sleep",
-        "pg_terminate_backend",
-        "pg_cancel_backend",
-        "pg_reload_conf",
-        "pg_rotate_logfile",
-        "pg_read_file",
-        "pg_read_binary_file",
-        "pg_ls_dir",
-        "pg_stat_file",
-        "lo_import",
-        "lo_export",
-        "dblink",
-        "dblink_exec",
-        "dblink_connect",
-        "dblink_open",
-        "pg_write_file",
-        "pg_execute_sql",
-        "copy_from",
-        "copy_to",
-    }
+    BUILTIN_DANGEROUS_FUNCTIONS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "pg_sleep",
+            "pg_terminate_backend",
+            "pg_cancel_backend",
+            "pg_reload_conf",
+            "pg_rotate_logfile",
+            "pg_read_file",
+            "pg_read_binary_file",
+            "pg_ls_dir",
+            "pg_stat_file",
+            "lo_import",
+            "lo_export",
+            "dblink",
+            "dblink_exec",
+            "dblink_connect",
+            "dblink_open",
+            "pg_write_file",
+            "pg_execute_sql",
+            "copy_from",
+            "copy_to",
+        }
+    )
 
     def __init__(
         self,
@@ -90,14 +153,13 @@ class SQLValidator:
             allow_explain: Whether to allow EXPLAIN statements.
         """
         self.config = config
-        self.blocked_tables = {t.lower() for t in (blocked_tables or [])}
-        self.blocked_columns = {c.lower() for c in (blocked_columns or [])}
+        self.blocked_tables = frozenset(t.lower() for t in (blocked_tables or []))
+        self.blocked_columns = frozenset(c.lower() for c in (blocked_columns or []))
         self.allow_explain = allow_explain
 
         # Combine built-in dangerous functions with custom blocked functions
-        self.blocked_functions = self.BUILTIN_DANGEROUS_FUNCTIONS | {
-            f.lower() for f in config.blocked_functions
-        }
+        # (already lowercased by SecurityConfig)
+        self.blocked_functions = self.BUILTIN_DANGEROUS_FUNCTIONS | config.blocked_functions
 
     def validate(self, sql: str) -> tuple[bool, str | None]:
         """Validate SQL query for security compliance.
@@ -128,9 +190,20 @@ class SQLValidator:
         if not sql or not sql.strip():
             raise SQLParseError("SQL query cannot be empty")
 
-        # Parse SQL using SQLGlot
+        # Reject write/DDL statements and disallowed EXPLAIN from the leading
+        # keyword alone; anything else still goes through the full parse
+        if keyword := _leading_keyword(sql):
+            keyword = keyword.upper()
+            if keyword in _WRITE_KEYWORDS:
+                raise SecurityViolationError(
+                    f"{keyword} statements are not allowed. Only SELECT queries are permitted."
+                )
+            if keyword == "EXPLAIN" and not self.allow_explain:
+                raise SecurityViolationError("EXPLAIN statements are not allowed")
+
+        # Parse SQL using SQLGlot (cached; security checks below only read the AST)
         try:
-            parsed = sqlglot.parse(sql, read="postgres")
+            parsed = _parse_postgres(sql)
         except Exception as e:
             raise SQLParseError(f"Failed to parse SQL: {e}") from e
 
@@ -181,16 +254,7 @@ class SQLValidator:
         if error := self._check_statement_type(main_query):
             raise SecurityViolationError(error)
 
-        if error := self._check_dangerous_functions(statement):
-            raise SecurityViolationError(error)
-
-        if error := self._check_blocked_tables(statement):
-            raise SecurityViolationError(error)
-
-        if error := self._check_blocked_columns(statement):
-            raise SecurityViolationError(error)
-
-        if error := self._check_subquery_safety(statement):
+        if error := self._check_nodes(statement):
             raise SecurityViolationError(error)
 
     def _check_statement_type(self, statement: exp.Expression) -> str | None:
@@ -215,29 +279,57 @@ class SQLValidator:
 
         return None
 
-    def _check_dangerous_functions(self, statement: exp.Expression) -> str | None:
-        """Check for use of blocked/dangerous functions.
+    def _check_nodes(self, statement: exp.Expression) -> str | None:
+        """Run the function, table, column and subquery checks in one AST walk.
+
+        When a query violates several checks, errors are reported in priority
+        order: functions, tables, columns, then subqueries.
 
         Args:
             statement: Parsed SQL statement.
 
+        Returns:
+            Error message if any check fails, None otherwise.
+        """
+        table_error: str | None = None
+        column_error: str | None = None
+        subquery_error: str | None = None
+
+        for node in statement.walk():
+            if isinstance(node, exp.Func):
+                # Highest priority, so the walk can stop at the first hit
+                if error := self._check_function(node):
+                    return error
+            elif isinstance(node, exp.Table) and table_error is None:
+                table_error = self._check_table(node)
+            elif isinstance(node, exp.Column) and column_error is None:
+                column_error = self._check_column(node)
+            elif isinstance(node, exp.Subquery) and subquery_error is None:
+                subquery_error = self._check_subquery(node)
+
+        return table_error or column_error or subquery_error
+
+    def _check_function(self, func: exp.Func) -> str | None:
+        """Check a function call against blocked/dangerous functions.
+
+        Args:
+            func: Function call node.
+
         Returns:
             Error message if check fails, None otherwise.
         """
-        # Find all function calls in the query
-        for func in statement.find_all(exp.Func):
-            func_name = func.name.lower() if func.name else ""
+        func_name = func.name.lower() if func.name else ""
 
-            if func_name in self.blocked_functions:
-                return f"Function '{func_name}' is blocked for security reasons"
+        if func_name in self.blocked_functions:
+            return f"Function '{func_name}' is blocked for security reasons"
 
         return None
 
-    def _check_blocked_tables(self, statement: exp.Expression) -> str | None:
-        """Check for access to blocked tables.
+    def _check_table(self, table: exp.Table) -> str | None:
+        """Check a table reference against blocked tables.
 
         Args:
-            statement: Parsed SQL statement.
+            table: Table reference node.
 
         Returns:
             Error message if check fails, None otherwise.
@@ -245,20 +337,18 @@ class SQLValidator:
         if not self.blocked_tables:
             return None
 
-        # Find all table references
-        for table in statement.find_all(exp.Table):
-            table_name = table.name.lower() if table.name else ""
+        table_name = table.name.lower() if table.name else ""
 
-            if table_name in self.blocked_tables:
-                return f"Access to table '{table_name}' is not allowed"
+        if table_name in self.blocked_tables:
+            return f"Access to table '{table_name}' is not allowed"
 
         return None
 
-    def _check_blocked_columns(self, statement: exp.Expression) -> str | None:
-        """Check for access to blocked columns.
+    def _check_column(self, column: exp.Column) -> str | None:
+        """Check a column reference against blocked columns.
 
         Args:
-            statement: Parsed SQL statement.
+            column: Column reference node.
 
         Returns:
             Error message if check fails, None otherwise.
@@ -266,45 +356,43 @@ class SQLValidator:
         if not self.blocked_columns:
             return None
 
-        # Find all column references
-        for column in statement.find_all(exp.Column):
-            column_name = column.name.lower() if column.name else ""
+        column_name = column.name.lower() if column.name else ""
 
-            # Check for exact match
-            if column_name in self.blocked_columns:
-                return f"Access to column '{column_name}' is not allowed"
+        # Check for exact match
+        if column_name in self.blocked_columns:
+            return f"Access to column '{column_name}' is not allowed"
 
-            # Check for qualified column names (table.column)
-            if column.table:
-                qualified_name = f"{column.table.lower()}.{column_name}"
-                if qualified_name in self.blocked_columns:
-                    return f"Access to column '{qualified_name}' is not allowed"
+        # Check for qualified column names (table.column)
+        if column.table:
+            qualified_name = f"{column.table.lower()}.{column_name}"
+            if qualified_name in self.blocked_columns:
+                return f"Access to column '{qualified_name}' is not allowed"
 
         return None
 
-    def _check_subquery_safety(self, statement: exp.Expression) -> str | None:
-        """Check that all subqueries only contain SELECT statements.
+    def _check_subquery(self, subquery: exp.Subquery) -> str | None:
+        """Check that a subquery only contains a SELECT statement.
 
         Args:
-            statement: Parsed SQL statement.
+            subquery: Subquery node.
 
         Returns:
             Error message if check fails, None otherwise.
         """
-        # Find all subqueries
-        for subquery in statement.find_all(exp.Subquery):
-            if subquery.this:
-                inner_stmt = subquery.this
-
-                # Check if the inner statement is a forbidden type
-                for forbidden_type in self.FORBIDDEN_STATEMENT_TYPES:
-                    if isinstance(inner_stmt, forbidden_type):
-                        stmt_name = forbidden_type.__name__.upper()
-                        return f"{stmt_name} statements in subqueries are not allowed"
-
-                # Ensure it's a SELECT
-                if not isinstance(inner_stmt, (exp.Select, exp.With)):
-                    return "Subqueries must contain only SELECT statements"
+        if not subquery.this:
+            return None
+
+        inner_stmt = subquery.this
+
+        # Check if the inner statement is a forbidden type
+        for forbidden_type in self.FORBIDDEN_STATEMENT_TYPES:
+            if isinstance(inner_stmt, forbidden_type):
+                stmt_name = forbidden_type.__name__.upper()
+                return f"{stmt_name} statements in subqueries are not allowed"
+
+        # Ensure it's a SELECT
+        if not isinstance(inner_stmt, (exp.Select, exp.With)):
+            return "Subqueries must contain only SELECT statements"
 
         return None
 
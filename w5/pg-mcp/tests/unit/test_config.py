@@ -168,7 +168,7 @@ class TestSecurityConfig:
         config = SecurityConfig(
             blocked_functions=["func1", "func2"],
         )
-        assert config.blocked_functions == ["func1", "func2"]
+        assert config.blocked_functions == frozenset({"func1", "func2"})
 
     def test_parse_blocked_functions_from_string(self) -> None:
         """Test parsing blocked functions from comma-separated string."""
@@ -179,6 +179,11 @@ class TestSecurityConfig:
         assert "func2" in config.blocked_functions
         assert "func3" in config.blocked_functions
 
+    def test_blocked_functions_are_lowercased(self) -> None:
+        """Test blocked functions are normalized to lowercase."""
+        config = SecurityConfig(blocked_functions=["My_Func", " OTHER_FUNC "])
+        assert config.blocked_functions == frozenset({"my_func", "other_func"})
+
     def test_allow_write_operations(self) -> None:
         """Test enabling write operations."""
         config = SecurityConfig(allow_write_operations=True)
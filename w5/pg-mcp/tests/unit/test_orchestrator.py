@@ -25,6 +25,34 @@ from pg_mcp.resilience.circuit_breaker import CircuitState
 from pg_mcp.services.orchestrator import QueryOrchestrator
 
 
+@pytest.fixture(scope="module")
+def mock_schema() -> DatabaseSchema:
+    """Create mock database schema."""
+    return DatabaseSchema(
+        database_name="test_db",
+        tables=[
+            TableInfo(
+                schema_name="public",
+                table_name="users",
+                columns=[
+                    ColumnInfo(
+                        name="id",
+                        data_type="integer",
+                        is_nullable=False,
+                        is_primary_key=True,
+                    ),
+                    ColumnInfo(
+                        name="name",
+                        data_type="varchar(255)",
+                        is_nullable=False,
+                    ),
+                ],
+            )
+        ],
+        version="15.0",
+    )
+
+
 class TestDatabaseResolution:
     """Test database name resolution logic."""
 
@@ -112,33 +140,6 @@ class TestDatabaseResolution:
 class TestSQLGenerationWithRetry:
     """Test SQL generation with retry logic."""
 
-    @pytest.fixture
-    def mock_schema(self) -> DatabaseSchema:
-        """Create mock database schema."""
-        return DatabaseSchema(
-            database_name="test_db",
-            tables=[
-                TableInfo(
-                    schema_name="public",
-                    table_name="users",
-                    columns=[
-                        ColumnInfo(
-                            name="id",
-                            data_type="integer",
-                            is_nullable=False,
-                            is_primary_key=True,
-                        ),
-                        ColumnInfo(
-                            name="name",
-                            data_type="varchar(255)",
-                            is_nullable=False,
-                        ),
-                    ],
-                )
-            ],
-            version="15.0",
-        )
-
     @pytest.mark.asyncio
     async def test_generate_sql_success_first_attempt(self, mock_schema: DatabaseSchema) -> None:
         """Test successful SQL generation on first attempt."""
@@ -410,33 +411,6 @@ class TestResultValidation:
 class TestExecuteQueryFlow:
     """Test complete query execution flow."""
 
-    @pytest.fixture
-    def mock_schema(self) -> DatabaseSchema:
-        """Create mock database schema."""
-        return DatabaseSchema(
-            database_name="test_db",
-            tables=[
-                TableInfo(
-                    schema_name="public",
-                    table_name="users",
-                    columns=[
-                        ColumnInfo(
-                            name="id",
-                            data_type="integer",
-                            is_nullable=False,
-                            is_primary_key=True,
-                        ),
-                        ColumnInfo(
-                            name="name",
-                            data_type="varchar(255)",
-                            is_nullable=False,
-                        ),
-                    ],
-                )
-            ],
-            version="15.0",
-        )
-
     @pytest.mark.asyncio
     async def test_execute_query_sql_only(self, mock_schema: DatabaseSchema) -> None:
         """Test executing query with return_type=SQL."""
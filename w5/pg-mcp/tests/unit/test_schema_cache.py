@@ -15,26 +15,45 @@ from pg_mcp.config.settings import CacheConfig
 from pg_mcp.models.schema import DatabaseSchema, TableInfo
 
 
-class TestSchemaCache:
-    """Test suite for SchemaCache class."""
+@pytest.fixture(scope="module")
+def cache_config() -> CacheConfig:
+    """Create cache configuration for testing."""
+    return CacheConfig(
+        schema_ttl=3600,  # 1 hour
+        max_size=100,
+        enabled=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def disabled_cache_config() -> CacheConfig:
+    """Create disabled cache configuration."""
+    return CacheConfig(
+        schema_ttl=3600,
+        max_size=100,
+        enabled=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_schema() -> DatabaseSchema:
+    """Create sample database schema for testing."""
+    return DatabaseSchema(
+        database_name="test_db",
+        tables=[
+            TableInfo(
+                schema_name="public",
+                table_name="users",
+                columns=[],
+            )
+        ],
+        enum_types=[],
+        version="PostgreSQL 16.0",
+    )
 
-    @pytest.fixture
-    def cache_config(self) -> CacheConfig:
-        """Create cache configuration for testing."""
-        return CacheConfig(
-            schema_ttl=3600,  # 1 hour
-            max_size=100,
-            enabled=True,
-        )
 
-    @pytest.fixture
-    def disabled_cache_config(self) -> CacheConfig:
-        """Create disabled cache configuration."""
-        return CacheConfig(
-            schema_ttl=3600,
-            max_size=100,
-            enabled=False,
-        )
+class TestSchemaCache:
+    """Test suite for SchemaCache class."""
 
     @pytest.fixture
     def cache(self, cache_config: CacheConfig) -> SchemaCache:
@@ -47,22 +66,6 @@ class TestSchemaCache:
         pool = MagicMock()
         return pool
 
-    @pytest.fixture
-    def sample_schema(self) -> DatabaseSchema:
-        """Create sample database schema for testing."""
-        return DatabaseSchema(
-            database_name="test_db",
-            tables=[
-                TableInfo(
-                    schema_name="public",
-                    table_name="users",
-                    columns=[],
-                )
-            ],
-            enum_types=[],
-            version="PostgreSQL 16.0",
-        )
-
     def test_get_returns_none_when_empty(self, cache: SchemaCache):
         """Test that get returns None when cache is empty."""
         result = cache.get("nonexistent_db")
@@ -8,6 +8,7 @@ import asyncio
 import datetime
 import decimal
 import uuid
+from collections.abc import Iterator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -19,26 +20,54 @@ from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
 from pg_mcp.services.sql_executor import SQLExecutor
 
 
-def create_mock_record(data: dict[str, Any]) -> MagicMock:
+class MockRecord:
+    """Lightweight stand-in for asyncpg.Record.
+
+    Like the real Record it is an immutable row of values with a shared key
+    order, supporting lookup by column name or position, ``keys()``,
+    ``values()``, ``items()`` and ``dict(record)``.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, keys: tuple[str, ...], values: tuple[Any, ...]) -> None:
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key: str | int) -> Any:
+        if isinstance(key, str):
+            return self._values[self._keys.index(key)]
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def keys(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def values(self) -> Iterator[Any]:
+        return iter(self._values)
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        return zip(self._keys, self._values, strict=True)
+
+
+def create_mock_record(data: dict[str, Any]) -> MockRecord:
     """Create a mock asyncpg.Record object that supports dict() conversion.
 
     Args:
         data: Dictionary of column names to values.
 
     Returns:
-        MagicMock that behaves like an asyncpg.Record.
+        MockRecord that behaves like an asyncpg.Record.
     """
-    mock_record = MagicMock()
-    mock_record.__iter__ = MagicMock(return_value=iter(data.items()))
-    mock_record.keys = MagicMock(return_value=list(data.keys()))
-    mock_record.values = MagicMock(return_value=list(data.values()))
-    mock_record.items = MagicMock(return_value=list(data.items()))
-    mock_record.__getitem__ = lambda self, key: data[key]
-    mock_record.__len__ = lambda self: len(data)
-    return mock_record
+    return MockRecord(tuple(data), tuple(data.values()))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def security_config() -> SecurityConfig:
     """Create a default security configuration for testing."""
     return SecurityConfig(
@@ -49,7 +78,7 @@ def security_config() -> SecurityConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def security_config_with_role() -> SecurityConfig:
     """Create security config with readonly role configured."""
     return SecurityConfig(
@@ -60,7 +89,7 @@ def security_config_with_role() -> SecurityConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def db_config() -> DatabaseConfig:
     """Create a default database configuration for testing."""
     return DatabaseConfig(
@@ -72,6 +101,23 @@ def db_config() -> DatabaseConfig:
     )
 
 
+@pytest.fixture(scope="module")
+def executor_for_serialization(
+    security_config: SecurityConfig,
+    db_config: DatabaseConfig,
+) -> SQLExecutor:
+    """Create one executor shared by the serialization tests.
+
+    Serialization never touches the pool, so a bare mock is enough and the
+    executor can be reused across the module.
+    """
+    return SQLExecutor(
+        pool=MagicMock(),
+        security_config=security_config,
+        db_config=db_config,
+    )
+
+
 @pytest.fixture
 def mock_connection() -> MagicMock:
     """Create a mock asyncpg connection."""
@@ -354,20 +400,6 @@ class TestSQLExecutor:
 class TestResultSerialization:
     """Test suite for result serialization."""
 
-    @pytest.fixture
-    def executor_for_serialization(
-        self,
-        mock_pool: MagicMock,
-        security_config: SecurityConfig,
-        db_config: DatabaseConfig,
-    ) -> SQLExecutor:
-        """Create executor for serialization tests."""
-        return SQLExecutor(
-            pool=mock_pool,
-            security_config=security_config,
-            db_config=db_config,
-        )
-
     def test_serialize_datetime_types(
         self,
         executor_for_serialization: SQLExecutor,
@@ -441,6 +473,26 @@ class TestResultSerialization:
         assert serialized[0]["id"] == "550e8400-e29b-41d4-a716-446655440000"
         assert isinstance(serialized[0]["id"], str)
 
+    def test_serialize_uuid_subclass(
+        self,
+        executor_for_serialization: SQLExecutor,
+    ) -> None:
+        """Test that UUID subclasses (as returned by asyncpg) serialize to strings."""
+
+        # Arrange
+        class RecordUUID(uuid.UUID):
+            pass
+
+        test_uuid = RecordUUID("550e8400-e29b-41d4-a716-446655440000")
+        results = [{"id": test_uuid}, {"id": test_uuid}]
+
+        # Act
+        serialized = executor_for_serialization._serialize_results(results)
+
+        # Assert
+        assert serialized[0]["id"] == "550e8400-e29b-41d4-a716-446655440000"
+        assert serialized[1]["id"] == "550e8400-e29b-41d4-a716-446655440000"
+
     def test_serialize_bytes(
         self,
         executor_for_serialization: SQLExecutor,
@@ -21,15 +21,113 @@ from pg_mcp.models.schema import (
 from pg_mcp.services.sql_generator import SQLGenerator
 
 
+@pytest.fixture(scope="module")
+def config() -> OpenAIConfig:
+    """Create test OpenAI config."""
+    return OpenAIConfig(
+        api_key=SecretStr("sk-test-key-12345"),
+        model="gpt-4o-mini",
+        temperature=0.0,
+        max_tokens=2000,
+        timeout=30.0,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_schema() -> DatabaseSchema:
+    """Create mock database schema."""
+    users_table = TableInfo(
+        schema_name="public",
+        table_name="users",
+        columns=[
+            ColumnInfo(
+                name="id",
+                data_type="integer",
+                is_nullable=False,
+                is_primary_key=True,
+            ),
+            ColumnInfo(
+                name="name",
+                data_type="varchar(255)",
+                is_nullable=False,
+            ),
+            ColumnInfo(
+                name="email",
+                data_type="varchar(255)",
+                is_nullable=False,
+                is_unique=True,
+            ),
+            ColumnInfo(
+                name="created_at",
+                data_type="timestamp",
+                is_nullable=False,
+                default_value="CURRENT_TIMESTAMP",
+            ),
+        ],
+        indexes=[
+            IndexInfo(
+                name="idx_users_email",
+                columns=["email"],
+                is_unique=True,
+                index_type="btree",
+            ),
+        ],
+    )
+
+    orders_table = TableInfo(
+        schema_name="public",
+        table_name="orders",
+        columns=[
+            ColumnInfo(
+                name="id",
+                data_type="integer",
+                is_nullable=False,
+                is_primary_key=True,
+            ),
+            ColumnInfo(
+                name="user_id",
+                data_type="integer",
+                is_nullable=False,
+            ),
+            ColumnInfo(
+                name="amount",
+                data_type="decimal(10,2)",
+                is_nullable=False,
+            ),
+            ColumnInfo(
+                name="created_at",
+                data_type="timestamp",
+                is_nullable=False,
+                default_value="CURRENT_TIMESTAMP",
+            ),
+        ],
+        foreign_keys=[
+            ForeignKeyInfo(
+                constraint_name="fk_orders_user",
+                column_name="user_id",
+                referenced_table="users",
+                referenced_column="id",
+            ),
+        ],
+    )
+
+    return DatabaseSchema(
+        database_name="test_db",
+        tables=[users_table, orders_table],
+        version="15.0",
+    )
+
+
+@pytest.fixture(scope="module")
+def generator() -> SQLGenerator:
+    """Create one SQLGenerator shared by the stateless extraction tests."""
+    config = OpenAIConfig(api_key=SecretStr("sk-test-key-12345"))
+    return SQLGenerator(config, client=MagicMock())
+
+
 class TestSQLExtraction:
     """Test SQL extraction logic from various response formats."""
 
-    @pytest.fixture
-    def generator(self) -> SQLGenerator:
-        """Create SQLGenerator instance with test config."""
-        config = OpenAIConfig(api_key=SecretStr("sk-test-key-12345"))
-        return SQLGenerator(config)
-
     def test_extract_sql_from_code_block(self, generator: SQLGenerator) -> None:
         """Test extraction from markdown SQL code block."""
         content = """Here's the query:
@@ -175,105 +273,10 @@ ORDER BY created_at DESC;
 class TestSQLGenerator:
     """Test SQL Generator with mocked OpenAI API."""
 
-    @pytest.fixture
-    def config(self) -> OpenAIConfig:
-        """Create test OpenAI config."""
-        return OpenAIConfig(
-            api_key=SecretStr("sk-test-key-12345"),
-            model="gpt-4o-mini",
-            temperature=0.0,
-            max_tokens=2000,
-            timeout=30.0,
-        )
-
     @pytest.fixture
     def generator(self, config: OpenAIConfig) -> SQLGenerator:
-        """Create SQLGenerator instance."""
-        return SQLGenerator(config)
-
-    @pytest.fixture
-    def mock_schema(self) -> DatabaseSchema:
-        """Create mock database schema."""
-        users_table = TableInfo(
-            schema_name="public",
-            table_name="users",
-            columns=[
-                ColumnInfo(
-                    name="id",
-                    data_type="integer",
-                    is_nullable=False,
-                    is_primary_key=True,
-                ),
-                ColumnInfo(
-                    name="name",
-                    data_type="varchar(255)",
-                    is_nullable=False,
-                ),
-                ColumnInfo(
-                    name="email",
-                    data_type="varchar(255)",
-                    is_nullable=False,
-                    is_unique=True,
-                ),
-                ColumnInfo(
-                    name="created_at",
-                    data_type="timestamp",
-                    is_nullable=False,
-                    default_value="CURRENT_TIMESTAMP",
-                ),
-            ],
-            indexes=[
-                IndexInfo(
-                    name="idx_users_email",
-                    columns=["email"],
-                    is_unique=True,
-                    index_type="btree",
-                ),
-            ],
-        )
-
-        orders_table = TableInfo(
-            schema_name="public",
-            table_name="orders",
-            columns=[
-                ColumnInfo(
-                    name="id",
-                    data_type="integer",
-                    is_nullable=False,
-                    is_primary_key=True,
-                ),
-                ColumnInfo(
-                    name="user_id",
-                    data_type="integer",
-                    is_nullable=False,
-                ),
-                ColumnInfo(
-                    name="amount",
-                    data_type="decimal(10,2)",
-                    is_nullable=False,
-                ),
-                ColumnInfo(
-                    name="created_at",
-                    data_type="timestamp",
-                    is_nullable=False,
-                    default_value="CURRENT_TIMESTAMP",
-                ),
-            ],
-            foreign_keys=[
-                ForeignKeyInfo(
-                    constraint_name="fk_orders_user",
-                    column_name="user_id",
-                    referenced_table="users",
-                    referenced_column="id",
-                ),
-            ],
-        )
-
-        return DatabaseSchema(
-            database_name="test_db",
-            tables=[users_table, orders_table],
-            version="15.0",
-        )
+        """Create SQLGenerator instance with an injected mock client."""
+        return SQLGenerator(config, client=MagicMock())
 
     @pytest.mark.asyncio
     async def test_generate_simple_query(
@@ -484,6 +487,23 @@ LIMIT 10;"""
             assert result.startswith("WITH recent_orders")
             assert "LIMIT 10;" in result
 
+    @pytest.mark.asyncio
+    async def test_generate_uses_injected_client(
+        self, config: OpenAIConfig, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that an injected client is used instead of building one."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="SELECT 1"))]
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        generator = SQLGenerator(config, client=client)
+        sql = await generator.generate("Test query", mock_schema)
+
+        assert generator.client is client
+        assert sql.startswith("SELECT 1")
+        client.chat.completions.create.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_generate_respects_config_settings(self, mock_schema: DatabaseSchema) -> None:
         """Test that generator respects all config settings."""
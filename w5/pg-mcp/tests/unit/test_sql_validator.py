@@ -9,6 +9,8 @@ Tests cover:
 - Edge cases and malformed SQL
 """
 
+import time
+
 import pytest
 
 from pg_mcp.config.settings import SecurityConfig
@@ -16,15 +18,16 @@ from pg_mcp.models.errors import SecurityViolationError, SQLParseError
 from pg_mcp.services.sql_validator import SQLValidator
 
 
+@pytest.fixture(scope="module")
+def validator() -> SQLValidator:
+    """Create one validator with the default security config for the module."""
+    config = SecurityConfig()
+    return SQLValidator(config=config)
+
+
 class TestValidStatements:
     """Test cases for valid SELECT statements that should pass validation."""
 
-    @pytest.fixture
-    def validator(self) -> SQLValidator:
-        """Create a basic validator with default security config."""
-        config = SecurityConfig()
-        return SQLValidator(config=config)
-
     def test_simple_select(self, validator: SQLValidator) -> None:
         """Test simple SELECT statement."""
         sql = "SELECT * FROM users"
@@ -151,12 +154,6 @@ class TestValidStatements:
 class TestRejectedStatements:
     """Test cases for write operations that should be rejected."""
 
-    @pytest.fixture
-    def validator(self) -> SQLValidator:
-        """Create validator for testing rejected statements."""
-        config = SecurityConfig(allow_write_operations=False)
-        return SQLValidator(config=config)
-
     def test_insert_rejected(self, validator: SQLValidator) -> None:
         """Test INSERT statement is rejected."""
         sql = "INSERT INTO users (name, email) VALUES ('John', 'john@example.com')"
@@ -213,16 +210,26 @@ class TestRejectedStatements:
             validator.validate_or_raise(sql)
         assert "GRANT" in str(exc_info.value).upper()
 
+    def test_write_after_leading_comments_rejected(self, validator: SQLValidator) -> None:
+        """Test write statement hidden behind leading comments is rejected."""
+        sql = "-- cleanup\n/* nightly */ delete FROM users"
+        with pytest.raises(SecurityViolationError) as exc_info:
+            validator.validate_or_raise(sql)
+        assert "DELETE" in str(exc_info.value).upper()
+
+    def test_many_leading_comments_validate_quickly(self, validator: SQLValidator) -> None:
+        """Test leading-comment scanning stays linear on adversarial input."""
+        sql = "/**/" * 40 + "(SELECT 1)"
+        start = time.perf_counter()
+        # A bare parenthesised query is rejected later as a Subquery
+        with pytest.raises(SecurityViolationError):
+            validator.validate_or_raise(sql)
+        assert time.perf_counter() - start < 0.5
+
 
 class TestDangerousFunctions:
     """Test cases for blocking dangerous PostgreSQL functions."""
 
-    @pytest.fixture
-    def validator(self) -> SQLValidator:
-        """Create validator with default dangerous function blocking."""
-        config = SecurityConfig()
-        return SQLValidator(config=config)
-
     def test_pg_sleep_blocked(self, validator: SQLValidator) -> None:
         """Test pg_sleep function is blocked."""
         sql = "SELECT pg_sleep(10)"
@@ -313,6 +320,18 @@ class TestSensitiveResources:
             validator.validate_or_raise(sql)
         assert "sensitive_data" in str(exc_info.value).lower()
 
+    def test_blocked_table_reported_before_blocked_column(self) -> None:
+        """Test blocked table wins over blocked column regardless of position."""
+        config = SecurityConfig()
+        validator = SQLValidator(
+            config=config, blocked_tables=["secrets"], blocked_columns=["password"]
+        )
+
+        sql = "SELECT password FROM secrets"
+        with pytest.raises(SecurityViolationError) as exc_info:
+            validator.validate_or_raise(sql)
+        assert "table 'secrets'" in str(exc_info.value).lower()
+
     def test_blocked_column_rejected(self) -> None:
         """Test access to blocked column is rejected."""
         config = SecurityConfig()
@@ -361,12 +380,6 @@ class TestSensitiveResources:
 class TestMultiStatement:
     """Test cases for detecting and blocking multi-statement queries."""
 
-    @pytest.fixture
-    def validator(self) -> SQLValidator:
-        """Create validator for multi-statement testing."""
-        config = SecurityConfig()
-        return SQLValidator(config=config)
-
     def test_multiple_statements_rejected(self, validator: SQLValidator) -> None:
         """Test multiple statements separated by semicolon are rejected."""
         sql = "SELECT * FROM users; SELECT * FROM orders;"
@@ -402,12 +415,6 @@ class TestMultiStatement:
 class TestEdgeCases:
     """Test edge cases and malformed SQL."""
 
-    @pytest.fixture
-    def validator(self) -> SQLValidator:
-        """Create validator for edge case testing."""
-        config = SecurityConfig()
-        return SQLValidator(config=config)
-
     def test_malformed_sql(self, validator: SQLValidator) -> None:
         """Test malformed SQL raises parse error."""
         sql = "SELECT * FROM WHERE"
@@ -452,6 +459,16 @@ class TestEdgeCases:
         assert is_valid
         assert error is None
 
+    def test_cached_parse_respects_each_validator_config(self, validator: SQLValidator) -> None:
+        """Test that re-validating the same SQL applies the current validator's rules."""
+        sql = "SELECT id FROM secrets"
+        strict = SQLValidator(config=SecurityConfig(), blocked_tables=["secrets"])
+
+        assert validator.validate(sql) == (True, None)
+        with pytest.raises(SecurityViolationError):
+            strict.validate_or_raise(sql)
+        assert validator.validate(sql) == (True, None)
+
 
 class TestExplainStatements:
     """Test EXPLAIN statement handling."""
@@ -505,12 +522,6 @@ class TestExplainStatements:
 class TestValidatorHelperMethods:
     """Test validator helper methods like normalize_sql and extract_tables."""
 
-    @pytest.fixture
-    def validator(self) -> SQLValidator:
-        """Create validator for testing helper methods."""
-        config = SecurityConfig()
-        return SQLValidator(config=config)
-
     def test_normalize_sql(self, validator: SQLValidator) -> None:
         """Test SQL normalization."""
         sql = """
@@ -575,12 +586,6 @@ class TestValidatorHelperMethods:
 class TestCTEWithDangerousOperations:
     """Test CTE (Common Table Expressions) with dangerous operations."""
 
-    @pytest.fixture
-    def validator(self) -> SQLValidator:
-        """Create validator for CTE testing."""
-        config = SecurityConfig()
-        return SQLValidator(config=config)
-
     def test_cte_with_multiple_selects(self, validator: SQLValidator) -> None:
         """Test CTE with multiple SELECT CTEs is allowed."""
         sql = """
@@ -623,12 +628,6 @@ class TestCTEWithDangerousOperations:
 class TestSubqueryWithForbiddenOperations:
     """Test that forbidden operations in subqueries are caught."""
 
-    @pytest.fixture
-    def validator(self) -> SQLValidator:
-        """Create validator for subquery testing."""
-        config = SecurityConfig()
-        return SQLValidator(config=config)
-
     def test_subquery_with_insert_rejected(self, validator: SQLValidator) -> None:
         """Test subquery containing INSERT is rejected."""
         # Note: This is syntactically invalid SQL, but we test the validator's safety
@@ -23,56 +23,48 @@ def get_settings() -> Settings:
     return Settings()
 
 
-def get_slide_repository(settings: Settings = None) -> SlideRepository:
+@lru_cache
+def get_slide_repository() -> SlideRepository:
     """
-    Get slide repository instance.
-
-    Args:
-        settings: Application settings
+    Get slide repository instance (cached).
 
     Returns:
         SlideRepository instance
     """
-    if settings is None:
-        settings = get_settings()
+    settings = get_settings()
     return SlideRepository(str(settings.get_slides_path()))
 
 
-def get_image_repository(settings: Settings = None) -> ImageRepository:
+@lru_cache
+def get_image_repository() -> ImageRepository:
     """
-    Get image repository instance.
-
-    Args:
-        settings: Application settings
+    Get image repository instance (cached).
 
     Returns:
         ImageRepository instance
     """
-    if settings is None:
-        settings = get_settings()
+    settings = get_settings()
     return ImageRepository(str(settings.get_slides_path()))
 
 
-def get_gemini_client(settings: Settings = None) -> GeminiClient:
+@lru_cache
+def get_gemini_client() -> GeminiClient:
     """
-    Get Gemini client instance.
-
-    Args:
-        settings: Application settings
+    Get Gemini client instance (cached).
 
     Returns:
         GeminiClient instance
     """
-    if settings is None:
-        settings = get_settings()
+    settings = get_settings()
     # Pass api_key only if it's set, otherwise let client use env var
     api_key = settings.gemini_api_key if settings.gemini_api_key else None
     return GeminiClient(api_key)
 
 
+@lru_cache
 def get_slide_service() -> SlideService:
     """
-    Get slide service instance.
+    Get slide service instance (cached).
 
     Returns:
         SlideService instance
@@ -82,9 +74,10 @@ def get_slide_service() -> SlideService:
     return SlideService(slide_repo, image_repo)
 
 
+@lru_cache
 def get_image_service() -> ImageService:
     """
-    Get image service instance.
+    Get image service instance (cached).
 
     Returns:
         ImageService instance
@@ -95,9 +88,10 @@ def get_image_service() -> ImageService:
     return ImageService(gemini_client, image_repo, slide_repo)
 
 
+@lru_cache
 def get_style_service() -> StyleService:
     """
-    Get style service instance.
+    Get style service instance (cached).
 
     Returns:
         StyleService instance
@@ -108,9 +102,10 @@ def get_style_service() -> StyleService:
     return StyleService(gemini_client, image_repo, slide_repo)
 
 
+@lru_cache
 def get_cost_service() -> CostService:
     """
-    Get cost service instance.
+    Get cost service instance (cached).
 
     Returns:
         CostService instance
@@ -0,0 +1,66 @@
+"""Shared HTTP response helpers for API routes."""
+
+import os
+from pathlib import Path
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Quoted ETag of the current representation
+
+    Returns:
+        True if the client already holds this representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def image_file_response(request: Request, path: Path, immutable: bool = False) -> Response:
+    """
+    Serve a JPEG image with caching headers and conditional GET support.
+
+    Immutable files (whose name never gets reused for new content) are tagged
+    by filename and cached for a year. Other files are tagged by filename and
+    modification time and must be revalidated, so a regenerated image with the
+    same name is picked up while unchanged ones still answer 304.
+
+    Args:
+        request: Incoming request
+        path: Path to an existing image file
+        immutable: Whether the file content never changes for this name
+
+    Returns:
+        304 response if the client copy is current, otherwise the file
+    """
+    stat_result: os.stat_result | None = None
+    if immutable:
+        etag = f'"{path.stem}"'
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        stat_result = path.stat()
+        etag = f'"{path.stem}-{stat_result.st_mtime_ns:x}"'
+        cache_control = REVALIDATE_CACHE_CONTROL
+
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        path, media_type="image/jpeg", headers=headers, stat_result=stat_result
+    )
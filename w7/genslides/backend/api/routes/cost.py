@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from api.dependencies import get_cost_service
-from api.schemas.cost import CostBreakdown, CostResponse
+from api.schemas.cost import CostResponse
 from services.cost_service import CostService
 
 router = APIRouter(prefix="/api/cost", tags=["cost"])
@@ -29,16 +29,6 @@ async def get_cost_stats(
     try:
         stats = service.get_cost_stats(slug)
 
-        return CostResponse(
-            slug=stats["slug"],
-            total_cost=stats["total_cost"],
-            currency=stats["currency"],
-            breakdown=CostBreakdown(
-                slide_images=stats["breakdown"]["slide_images"],
-                style_images=stats["breakdown"]["style_images"],
-            ),
-            image_count=stats["image_count"],
-            cost_per_image=stats["cost_per_image"],
-        )
+        return CostResponse.model_validate(stats)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
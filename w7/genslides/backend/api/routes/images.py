@@ -2,21 +2,26 @@
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from api.dependencies import get_image_service, get_slide_repository
-
-logger = logging.getLogger(__name__)
+from api.dependencies import (
+    get_image_repository,
+    get_image_service,
+    get_slide_repository,
+)
+from api.responses import image_file_response
 from api.schemas.image import (
     GenerateImageRequest,
     GenerateImageResponse,
     ImageInfo,
     SlideImagesResponse,
 )
+from repositories.image_repository import ImageRepository
 from repositories.slide_repository import SlideRepository
 from services.image_service import ImageService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/slides", tags=["images"])
 
 
@@ -49,19 +54,22 @@ async def get_slide_images(
 
         images = service.get_slide_images(slug, sid)
         current_hash = slide.content_hash
+        url_prefix = f"/api/slides/{slug}/{sid}/images/"
 
+        # Fields come straight from the repository and are already typed, so
+        # skip per-item validation; the response model still checks the output
         image_infos = [
-            ImageInfo(
+            ImageInfo.model_construct(
                 filename=img.filename,
                 content_hash=img.content_hash,
-                url=f"/api/slides/{slug}/{sid}/images/{img.filename}",
+                url=url_prefix + img.filename,
                 is_current=(img.content_hash == current_hash),
                 created_at=img.created_at,
             )
             for img in images
         ]
 
-        return SlideImagesResponse(
+        return SlideImagesResponse.model_construct(
             sid=sid,
             current_content_hash=current_hash,
             images=image_infos,
@@ -72,19 +80,21 @@ async def get_slide_images(
 
 @router.get("/{slug}/{sid}/images/{filename}")
 async def get_image(
+    request: Request,
     slug: str,
     sid: str,
     filename: str,
-    service: ImageService = Depends(get_image_service),
+    image_repo: ImageRepository = Depends(get_image_repository),
 ):
     """
     Get a specific image file.
 
     Args:
+        request: Incoming request (for conditional GET headers)
         slug: Project identifier
         sid: Slide ID
         filename: Image filename
-        service: Image service instance
+        image_repo: Image repository instance
 
     Returns:
         Image file
@@ -92,21 +102,17 @@ async def get_image(
     Raises:
         HTTPException: 404 if image not found
     """
-    from repositories.image_repository import ImageRepository
-    from config import Settings
-
-    settings = Settings()
-    image_repo = ImageRepository(settings.slides_base_path)
-
     content_hash = filename.rsplit(".", 1)[0]
     image_path = image_repo.get_image_path(slug, sid, content_hash)
 
-    if not image_path or not image_path.exists():
+    if not image_path:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
         )
 
-    return FileResponse(image_path, media_type="image/jpeg")
+    # Regenerating a slide with unchanged content overwrites {hash}.jpg,
+    # so slide images are revalidated rather than cached as immutable
+    return image_file_response(request, image_path)
 
 
 @router.post("/{slug}/{sid}/generate", response_model=GenerateImageResponse)
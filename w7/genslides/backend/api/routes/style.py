@@ -2,10 +2,10 @@
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from api.dependencies import get_style_service
+from api.dependencies import get_image_repository, get_style_service
+from api.responses import image_file_response
 from api.schemas.style import (
     GenerateStyleRequest,
     GenerateStyleResponse,
@@ -15,6 +15,7 @@ from api.schemas.style import (
     StyleCandidate,
     StyleResponse,
 )
+from repositories.image_repository import ImageRepository
 from services.style_service import StyleService
 
 logger = logging.getLogger(__name__)
@@ -43,16 +44,16 @@ async def get_style(
         style = service.get_style(slug)
 
         if style:
-            return GetStyleResponse(
+            return GetStyleResponse.model_construct(
                 has_style=True,
-                style=StyleResponse(
+                style=StyleResponse.model_construct(
                     prompt=style.prompt,
                     image=style.image,
                     image_url=f"/api/slides/{slug}/style/{style.image}",
                 ),
             )
         else:
-            return GetStyleResponse(has_style=False, style=None)
+            return GetStyleResponse.model_construct(has_style=False, style=None)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -82,10 +83,12 @@ async def generate_style_candidates(
             slug, request.prompt
         )
 
+        url_prefix = f"/api/slides/{slug}/style/"
+
         candidate_responses = [
             StyleCandidate(
                 filename=c.filename,
-                url=f"/api/slides/{slug}/style/{c.filename}",
+                url=url_prefix + c.filename,
             )
             for c in candidates
         ]
@@ -142,15 +145,19 @@ async def select_style(
 
 @router.get("/{slug}/style/{filename}")
 async def get_style_image(
-    slug: str, filename: str, service: StyleService = Depends(get_style_service)
+    request: Request,
+    slug: str,
+    filename: str,
+    image_repo: ImageRepository = Depends(get_image_repository),
 ):
     """
     Get a style image file.
 
     Args:
+        request: Incoming request (for conditional GET headers)
         slug: Project identifier
         filename: Image filename
-        service: Style service instance
+        image_repo: Image repository instance
 
     Returns:
         Image file
@@ -158,17 +165,12 @@ async def get_style_image(
     Raises:
         HTTPException: 404 if image not found
     """
-    from repositories.image_repository import ImageRepository
-    from config import Settings
-
-    settings = Settings()
-    image_repo = ImageRepository(settings.slides_base_path)
-
     image_path = image_repo.get_style_image_path(slug, filename)
 
-    if not image_path or not image_path.exists():
+    if not image_path:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Style image not found"
         )
 
-    return FileResponse(image_path, media_type="image/jpeg")
+    # Style candidates get a unique filename each time, so they never change
+    return image_file_response(request, image_path, immutable=True)
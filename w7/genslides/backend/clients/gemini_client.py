@@ -83,30 +83,45 @@ class GeminiClient:
         Returns:
             List of generated image binary data
         """
-        candidates = []
         style_prompt = f"Generate an artistic image showcasing the '{prompt}' style. This image will be used as a style reference for subsequent image generation. Make it visually distinctive and representative of this style."
 
-        for i in range(count):
-            varied_prompt = f"{style_prompt} (variation {i + 1}, make it unique)"
-
-            # Run synchronous API call in thread pool to avoid blocking event loop
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=self.MODEL_NAME,
-                contents=[varied_prompt],
-                config=types.GenerateContentConfig(
-                    image_config=types.ImageConfig(
-                        aspect_ratio="16:9",
-                        image_size="2K",
-                    )
-                ),
-            )
-
-            # Extract image from response
-            for part in response.parts:
-                if part.inline_data is not None:
-                    # Get the raw image bytes directly from inline_data
-                    candidates.append(part.inline_data.data)
-                    break
-
-        return candidates
+        # Variations are independent, so request them concurrently
+        results = await asyncio.gather(
+            *(self._generate_style_variation(style_prompt, i) for i in range(count))
+        )
+
+        return [image for image in results if image is not None]
+
+    async def _generate_style_variation(self, style_prompt: str, index: int) -> bytes | None:
+        """
+        Generate a single style candidate variation.
+
+        Args:
+            style_prompt: Base style prompt
+            index: Zero-based variation index
+
+        Returns:
+            Generated image binary data, or None if the response has no image
+        """
+        varied_prompt = f"{style_prompt} (variation {index + 1}, make it unique)"
+
+        # Run synchronous API call in thread pool to avoid blocking event loop
+        response = await asyncio.to_thread(
+            self.client.models.generate_content,
+            model=self.MODEL_NAME,
+            contents=[varied_prompt],
+            config=types.GenerateContentConfig(
+                image_config=types.ImageConfig(
+                    aspect_ratio="16:9",
+                    image_size="2K",
+                )
+            ),
+        )
+
+        # Extract image from response
+        for part in response.parts:
+            if part.inline_data is not None:
+                # Get the raw image bytes directly from inline_data
+                return part.inline_data.data
+
+        return None
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 
 
@@ -16,12 +17,18 @@ class Settings(BaseSettings):
 
     model_config = {"env_file": ".env"}
 
+    _slides_path: Path | None = PrivateAttr(default=None)
+
     def get_slides_path(self) -> Path:
-        """Get absolute path to slides directory."""
+        """Get absolute path to slides directory, creating it on first call."""
+        if self._slides_path is not None:
+            return self._slides_path
+
         path = Path(self.slides_base_path)
         if not path.is_absolute():
             # Resolve relative to the backend directory
             backend_dir = Path(__file__).parent
             path = backend_dir / path
         path.mkdir(parents=True, exist_ok=True)
-        return path.resolve()
+        self._slides_path = path.resolve()
+        return self._slides_path
@@ -1,13 +1,14 @@
 """FastAPI application entry point."""
 
+import json
 import logging
 import sys
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.dependencies import get_settings
 from api.routes import cost, images, slides, style
-from config import Settings
 
 # Configure logging
 logging.basicConfig(
@@ -18,7 +19,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-settings = Settings()
+settings = get_settings()
 
 app = FastAPI(
     title="GenSlides API",
@@ -43,20 +44,24 @@ app.include_router(cost.router)
 app.include_router(slides.router)
 
 
+# Constant bodies for the root and health endpoints, encoded once at import
+_ROOT_BODY = json.dumps(
+    {"name": "GenSlides API", "version": "0.1.0", "status": "running"},
+    separators=(",", ":"),
+).encode("utf-8")
+_HEALTH_BODY = json.dumps({"status": "healthy"}, separators=(",", ":")).encode("utf-8")
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "name": "GenSlides API",
-        "version": "0.1.0",
-        "status": "running",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ from models.slide import Slide
 from models.style import Style
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Represents a slides project with metadata and slides."""
 
@@ -14,3 +14,18 @@ class Project:
     slides: list[Slide] = field(default_factory=list)
     style: Style | None = None
     total_cost: float = 0.0
+
+    def get_slide(self, sid: str) -> Slide | None:
+        """
+        Find a slide in this project.
+
+        Args:
+            sid: Slide ID
+
+        Returns:
+            Slide object if found, None otherwise
+        """
+        for slide in self.slides:
+            if slide.sid == sid:
+                return slide
+        return None
@@ -1,12 +1,12 @@
 """Slide domain model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from utils.hash import compute_blake3
 
 
-@dataclass
+@dataclass(slots=True)
 class Slide:
     """Represents a single slide in a presentation."""
 
@@ -16,12 +16,21 @@ class Slide:
     updated_at: datetime
     default_image: str | None = None  # Filename of the selected default image
 
+    # Memoized content_hash and the content string it was computed from
+    _hash_content: str | None = field(default=None, init=False, repr=False, compare=False)
+    _content_hash: str = field(default="", init=False, repr=False, compare=False)
+
     @property
     def content_hash(self) -> str:
         """
         Compute blake3 hash based on content.
 
+        The hash is cached and recomputed only after ``content`` is reassigned.
+
         Returns:
             The blake3 hash of the slide content (16 characters)
         """
-        return compute_blake3(self.content)
+        if self._hash_content is not self.content:
+            self._content_hash = compute_blake3(self.content)
+            self._hash_content = self.content
+        return self._content_hash
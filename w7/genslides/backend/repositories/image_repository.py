@@ -1,8 +1,36 @@
 """Image file persistence repository."""
 
+import os
+import shutil
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+from utils.files import write_atomic
+
+
+def _is_image_entry(entry: os.DirEntry) -> bool:
+    """Check whether a directory entry is a visible JPEG image file."""
+    name = entry.name
+    return name.endswith(".jpg") and not name.startswith(".") and entry.is_file()
+
+
+@lru_cache(maxsize=4)
+def _read_image_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read an image file, memoized on its path and (mtime_ns, size).
+
+    Args:
+        path: Image file path
+        mtime_ns: File modification time, part of the cache key
+        size: File size, part of the cache key
+
+    Returns:
+        File contents
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
 
 class ImageInfo:
     """Information about a stored image."""
@@ -37,10 +65,12 @@ class ImageRepository:
             base_path: Base directory for slides storage
         """
         self.base_path = Path(base_path)
+        # Plain-string root for the directory listings, which only need str paths
+        self._base_dir = str(self.base_path)
 
     def save_image(
         self, slug: str, sid: str, content_hash: str, image_data: bytes
-    ) -> str:
+    ) -> ImageInfo:
         """
         Save an image file.
 
@@ -51,18 +81,20 @@ class ImageRepository:
             image_data: Image binary data
 
         Returns:
-            Path to saved image file (relative to project root)
+            ImageInfo for the saved image, as list_images would report it
         """
         image_dir = self.base_path / slug / "images" / sid
         image_dir.mkdir(parents=True, exist_ok=True)
 
         filename = f"{content_hash}.jpg"
         image_path = image_dir / filename
+        write_atomic(image_path, image_data)
 
-        with open(image_path, "wb") as f:
-            f.write(image_data)
-
-        return filename
+        return ImageInfo(
+            filename=filename,
+            content_hash=content_hash,
+            created_at=datetime.fromtimestamp(image_path.stat().st_mtime, tz=timezone.utc),
+        )
 
     def get_image_path(
         self, slug: str, sid: str, content_hash: str
@@ -96,25 +128,56 @@ class ImageRepository:
         Returns:
             List of ImageInfo objects
         """
-        image_dir = self.base_path / slug / "images" / sid
-        if not image_dir.exists():
+        image_dir = os.path.join(self._base_dir, slug, "images", sid)
+
+        # Single directory scan, one stat per image (used for ordering and
+        # created_at alike)
+        entries: list[tuple[float, str]] = []
+        try:
+            with os.scandir(image_dir) as it:
+                for entry in it:
+                    if _is_image_entry(entry):
+                        entries.append((entry.stat().st_mtime, entry.name))
+        except FileNotFoundError:
             return []
 
-        images = []
-        for image_file in sorted(image_dir.glob("*.jpg"), key=lambda p: p.stat().st_mtime):
-            content_hash = image_file.stem
-            created_at = datetime.fromtimestamp(
-                image_file.stat().st_mtime, tz=timezone.utc
-            )
-            images.append(
-                ImageInfo(
-                    filename=image_file.name,
-                    content_hash=content_hash,
-                    created_at=created_at,
-                )
+        entries.sort(key=lambda e: e[0])
+
+        return [
+            ImageInfo(
+                filename=name,
+                content_hash=name[: -len(".jpg")],
+                created_at=datetime.fromtimestamp(mtime, tz=timezone.utc),
             )
+            for mtime, name in entries
+        ]
+
+    def count_slide_images(self, slug: str) -> dict[str, int]:
+        """
+        Count images for every slide of a project in one pass.
 
-        return images
+        Args:
+            slug: Project identifier
+
+        Returns:
+            Mapping of slide ID to image count (slides without images are omitted)
+        """
+        images_dir = os.path.join(self._base_dir, slug, "images")
+
+        counts: dict[str, int] = {}
+        try:
+            with os.scandir(images_dir) as slide_dirs:
+                for slide_dir in slide_dirs:
+                    if slide_dir.name == "style" or not slide_dir.is_dir():
+                        continue
+                    with os.scandir(slide_dir.path) as it:
+                        count = sum(1 for entry in it if _is_image_entry(entry))
+                    if count:
+                        counts[slide_dir.name] = count
+        except FileNotFoundError:
+            return {}
+
+        return counts
 
     def delete_image(self, slug: str, sid: str, content_hash: str) -> None:
         """
@@ -144,10 +207,33 @@ class ImageRepository:
         style_dir = self.base_path / slug / "images" / "style"
         style_dir.mkdir(parents=True, exist_ok=True)
 
+        write_atomic(style_dir / filename, image_data)
+
+        return filename
+
+    def copy_style_image(self, slug: str, source_filename: str, filename: str) -> str:
+        """
+        Copy an existing style image to a new filename without reading it into memory.
+
+        Images are only ever replaced atomically, never rewritten in place, so a
+        hard link is a safe copy; a real file copy is used where linking fails.
+
+        Args:
+            slug: Project identifier
+            source_filename: Existing style image filename
+            filename: Filename for the copy
+
+        Returns:
+            Filename of the copied image
+        """
+        style_dir = self.base_path / slug / "images" / "style"
+        source_path = style_dir / source_filename
         image_path = style_dir / filename
 
-        with open(image_path, "wb") as f:
-            f.write(image_data)
+        try:
+            os.link(source_path, image_path)
+        except OSError:
+            shutil.copyfile(source_path, image_path)
 
         return filename
 
@@ -168,6 +254,25 @@ class ImageRepository:
             return image_path
         return None
 
+    def read_style_image(self, slug: str, filename: str) -> bytes | None:
+        """
+        Read a style image, reusing the bytes while the file is unchanged.
+
+        Args:
+            slug: Project identifier
+            filename: Style image filename
+
+        Returns:
+            Style image binary data if it exists, None otherwise
+        """
+        image_path = os.path.join(self._base_dir, slug, "images", "style", filename)
+        try:
+            stat_result = os.stat(image_path)
+        except FileNotFoundError:
+            return None
+
+        return _read_image_bytes(image_path, stat_result.st_mtime_ns, stat_result.st_size)
+
     def list_style_images(self, slug: str) -> list[str]:
         """
         List all style images for a project.
@@ -178,8 +283,10 @@ class ImageRepository:
         Returns:
             List of style image filenames
         """
-        style_dir = self.base_path / slug / "images" / "style"
-        if not style_dir.exists():
-            return []
+        style_dir = os.path.join(self._base_dir, slug, "images", "style")
 
-        return [f.name for f in style_dir.glob("*.jpg")]
+        try:
+            with os.scandir(style_dir) as it:
+                return [entry.name for entry in it if _is_image_entry(entry)]
+        except FileNotFoundError:
+            return []
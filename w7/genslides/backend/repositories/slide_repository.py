@@ -6,9 +6,17 @@ from pathlib import Path
 
 import yaml
 
+try:
+    # libyaml-backed C implementations, when PyYAML was built with them
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 from models.project import Project
 from models.slide import Slide
 from models.style import Style
+from utils.files import write_atomic
 
 
 class SlideRepository:
@@ -23,24 +31,52 @@ class SlideRepository:
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # Parsed outline data per slug, keyed by the file's (mtime_ns, size)
+        self._outline_cache: dict[str, tuple[tuple[int, int], dict]] = {}
 
-    def get_project(self, slug: str) -> Project | None:
+    def _load_outline(self, slug: str) -> dict | None:
         """
-        Get project by slug.
+        Load a project's parsed outline.yml, reusing the last parse if unchanged.
 
         Args:
             slug: Project identifier
 
         Returns:
-            Project object if exists, None otherwise
+            Parsed outline data if the project exists, None otherwise
         """
         outline_path = self.base_path / slug / "outline.yml"
-        if not outline_path.exists():
+        try:
+            stat_result = outline_path.stat()
+        except FileNotFoundError:
+            self._outline_cache.pop(slug, None)
             return None
 
+        version = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._outline_cache.get(slug)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         with open(outline_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
+
+        self._outline_cache[slug] = (version, data)
+        return data
 
+    def get_project(self, slug: str) -> Project | None:
+        """
+        Get project by slug.
+
+        Args:
+            slug: Project identifier
+
+        Returns:
+            Project object if exists, None otherwise
+        """
+        data = self._load_outline(slug)
+        if data is None:
+            return None
+
+        # Build fresh domain objects; callers may mutate and save them
         style = None
         if data.get("style"):
             style = Style(
@@ -103,8 +139,13 @@ class SlideRepository:
                 "image": project.style.image,
             }
 
-        with open(outline_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, allow_unicode=True, sort_keys=False)
+        text = yaml.dump(data, Dumper=SafeDumper, allow_unicode=True, sort_keys=False)
+        write_atomic(outline_path, text.encode("utf-8"))
+
+        # Write-through: the next get_project reuses the data just saved
+        # instead of parsing it back from disk
+        stat_result = outline_path.stat()
+        self._outline_cache[slug] = ((stat_result.st_mtime_ns, stat_result.st_size), data)
 
     def create_project(self, slug: str, title: str) -> Project:
         """
@@ -133,6 +174,7 @@ class SlideRepository:
         project_dir = self.base_path / slug
         if project_dir.exists():
             shutil.rmtree(project_dir)
+        self._outline_cache.pop(slug, None)
 
     def project_exists(self, slug: str) -> bool:
         """
@@ -171,8 +213,4 @@ class SlideRepository:
         if not project:
             return None
 
-        for slide in project.slides:
-            if slide.sid == sid:
-                return slide
-
-        return None
+        return project.get_slide(sid)
@@ -1,5 +1,6 @@
 """Cost calculation business logic service."""
 
+from clients.gemini_client import GeminiClient
 from repositories.image_repository import ImageRepository
 from repositories.slide_repository import SlideRepository
 
@@ -39,17 +40,13 @@ class CostService:
         if not project:
             raise ValueError(f"Project '{slug}' not found")
 
-        total_slide_images = 0
-        for slide in project.slides:
-            images = self.image_repo.list_images(slug, slide.sid)
-            total_slide_images += len(images)
+        image_counts = self.image_repo.count_slide_images(slug)
+        total_slide_images = sum(image_counts.get(slide.sid, 0) for slide in project.slides)
 
         style_images = len(self.image_repo.list_style_images(slug))
 
         total_images = total_slide_images + style_images
 
-        from clients.gemini_client import GeminiClient
-
         cost_per_image = GeminiClient.COST_PER_IMAGE
 
         slide_images_cost = total_slide_images * cost_per_image
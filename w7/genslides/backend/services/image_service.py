@@ -1,5 +1,7 @@
 """Image generation business logic service."""
 
+import asyncio
+
 from clients.gemini_client import GeminiClient
 from repositories.image_repository import ImageInfo, ImageRepository
 from repositories.slide_repository import SlideRepository
@@ -47,7 +49,7 @@ class ImageService:
         if not project:
             raise ValueError(f"Project '{slug}' not found")
 
-        slide = self.slide_repo.get_slide(slug, sid)
+        slide = project.get_slide(sid)
         if not slide:
             raise ValueError(f"Slide '{sid}' not found in project '{slug}'")
 
@@ -55,29 +57,25 @@ class ImageService:
 
         style_image_data = None
         if project.style:
-            style_image_path = self.image_repo.get_style_image_path(
-                slug, project.style.image
+            # Style references are multi-MB; read them off the event loop
+            style_image_data = await asyncio.to_thread(
+                self.image_repo.read_style_image, slug, project.style.image
             )
-            if style_image_path:
-                with open(style_image_path, "rb") as f:
-                    style_image_data = f.read()
 
         image_data = await self.gemini_client.generate_image(prompt, style_image_data)
 
-        filename = self.image_repo.save_image(
-            slug, sid, slide.content_hash, image_data
-        )
-
-        images = self.image_repo.list_images(slug, sid)
-        image_info = next(
-            (img for img in images if img.filename == filename), None
+        image_info = await asyncio.to_thread(
+            self.image_repo.save_image, slug, sid, slide.content_hash, image_data
         )
 
-        if not image_info:
-            raise ValueError("Failed to retrieve saved image")
-
-        project.total_cost += GeminiClient.COST_PER_IMAGE
-        self.slide_repo.save_project(slug, project)
+        # Re-read the project instead of reusing the copy loaded before
+        # generation, so slide edits made meanwhile are not overwritten. The
+        # read-modify-write stays on the event loop, like the slides routes,
+        # so it cannot interleave with their writes to outline.yml.
+        project = self.slide_repo.get_project(slug)
+        if project:
+            project.total_cost += GeminiClient.COST_PER_IMAGE
+            self.slide_repo.save_project(slug, project)
 
         return image_info, GeminiClient.COST_PER_IMAGE
 
@@ -99,7 +97,7 @@ class ImageService:
         if not project:
             raise ValueError(f"Project '{slug}' not found")
 
-        slide = self.slide_repo.get_slide(slug, sid)
+        slide = project.get_slide(sid)
         if not slide:
             raise ValueError(f"Slide '{sid}' not found in project '{slug}'")
 
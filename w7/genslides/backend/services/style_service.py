@@ -100,11 +100,7 @@ class StyleService:
             raise ValueError(f"Style image '{image_filename}' not found")
 
         final_filename = f"style_{uuid.uuid4().hex[:8]}.jpg"
-
-        with open(image_path, "rb") as f:
-            image_data = f.read()
-
-        self.image_repo.save_style_image(slug, image_data, final_filename)
+        self.image_repo.copy_style_image(slug, image_filename, final_filename)
 
         style = Style(prompt=prompt, image=final_filename)
         project.style = style
@@ -0,0 +1,26 @@
+"""File writing utilities."""
+
+import os
+import uuid
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file so readers only ever see the old or the complete new content.
+
+    Data goes to a hidden temporary file in the same directory, which is then
+    renamed over the target.
+
+    Args:
+        path: Destination file path
+        data: File contents
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -13,4 +13,5 @@ def compute_blake3(content: str) -> str:
     Returns:
         The first 16 characters of the blake3 hash in hexadecimal format
     """
-    return blake3.blake3(content.encode("utf-8")).hexdigest()[:16]
+    # blake3 output is extendable, so ask for just the 8 bytes we keep
+    return blake3.blake3(content.encode("utf-8")).digest(length=8).hex()
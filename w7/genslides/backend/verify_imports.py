@@ -1,68 +1,107 @@
 #!/usr/bin/env python3
 """Verify all imports work correctly."""
 
+import importlib
+import pkgutil
+import time
+
+
+def _route_targets():
+    """Discover every module in api.routes; each must export a router."""
+    routes = importlib.import_module("api.routes")
+    return tuple(
+        (info.name, ("router",))
+        for info in pkgutil.iter_modules(routes.__path__, prefix="api.routes.")
+    )
+
+
+# (progress label, ((module, (required attributes...)), ...)); a callable
+# in place of the module tuple is resolved at run time
+IMPORT_TARGETS = (
+    ("config", (
+        ("config", ("Settings",)),
+    )),
+    ("utils", (
+        ("utils.hash", ("compute_blake3",)),
+        ("utils.files", ("write_atomic",)),
+    )),
+    ("models", (
+        ("models.style", ("Style",)),
+        ("models.slide", ("Slide",)),
+        ("models.project", ("Project",)),
+    )),
+    ("clients", (
+        ("clients.gemini_client", ("GeminiClient",)),
+    )),
+    ("repositories", (
+        ("repositories.slide_repository", ("SlideRepository",)),
+        ("repositories.image_repository", ("ImageRepository",)),
+    )),
+    ("services", (
+        ("services.slide_service", ("SlideService",)),
+        ("services.image_service", ("ImageService",)),
+        ("services.style_service", ("StyleService",)),
+        ("services.cost_service", ("CostService",)),
+    )),
+    ("API schemas", (
+        ("api.schemas.slide", ("SlideResponse", "ProjectResponse")),
+        ("api.schemas.image", ("ImageInfo", "GenerateImageResponse")),
+        ("api.schemas.style", ("StyleResponse", "GenerateStyleResponse")),
+        ("api.schemas.cost", ("CostResponse",)),
+    )),
+    ("API dependencies", (
+        ("api.dependencies", (
+            "get_settings",
+            "get_slide_service",
+            "get_image_service",
+            "get_style_service",
+            "get_cost_service",
+        )),
+    )),
+    ("API routes", _route_targets),
+    ("main app", (
+        ("main", ("app",)),
+    )),
+)
+
 print("Verifying imports...")
 
+# (nanoseconds, module); a module's time includes whatever it imports
+# first, so shared dependencies are charged to the earliest importer
+timings: list[tuple[int, str]] = []
+
 try:
-    # Core imports
-    print("✓ Importing config...")
-    from config import Settings
-    
-    print("✓ Importing utils...")
+    for label, modules in IMPORT_TARGETS:
+        print(f"✓ Importing {label}...")
+        if callable(modules):
+            modules = modules()
+        for module_name, attrs in modules:
+            start = time.perf_counter_ns()
+            module = importlib.import_module(module_name)
+            timings.append((time.perf_counter_ns() - start, module_name))
+            for attr in attrs:
+                # Raises AttributeError if the module no longer exports it
+                getattr(module, attr)
+
+    from api.dependencies import get_settings
     from utils.hash import compute_blake3
-    
-    print("✓ Importing models...")
-    from models.style import Style
-    from models.slide import Slide
-    from models.project import Project
-    
-    print("✓ Importing clients...")
-    from clients.gemini_client import GeminiClient
-    
-    print("✓ Importing repositories...")
-    from repositories.slide_repository import SlideRepository
-    from repositories.image_repository import ImageRepository
-    
-    print("✓ Importing services...")
-    from services.slide_service import SlideService
-    from services.image_service import ImageService
-    from services.style_service import StyleService
-    from services.cost_service import CostService
-    
-    print("✓ Importing API schemas...")
-    from api.schemas.slide import SlideResponse, ProjectResponse
-    from api.schemas.image import ImageInfo, GenerateImageResponse
-    from api.schemas.style import StyleResponse, GenerateStyleResponse
-    from api.schemas.cost import CostResponse
-    
-    print("✓ Importing API dependencies...")
-    from api.dependencies import (
-        get_settings,
-        get_slide_service,
-        get_image_service,
-        get_style_service,
-        get_cost_service,
-    )
-    
-    print("✓ Importing API routes...")
-    from api.routes import slides, images, style, cost
-    
-    print("✓ Importing main app...")
-    from main import app
-    
+
     print("\n✅ All imports successful!")
+    print("\nTop 5 slowest imports:")
+    for elapsed_ns, module_name in sorted(timings, reverse=True)[:5]:
+        print(f"  {elapsed_ns / 1e6:7.1f}ms  {module_name}")
     print("\nQuick functionality test:")
-    
+
     # Test hash computation
     test_hash = compute_blake3("test content")
     print(f"✓ Hash computation works: {test_hash}")
-    
-    # Test settings
-    settings = Settings()
+
+    # Test settings (the same cached instance the app uses)
+    settings = get_settings()
     print(f"✓ Settings loaded: slides_base_path={settings.slides_base_path}")
-    
+
     print("\n🎉 Backend implementation is complete and functional!")
-    
+
 except ImportError as e:
     print(f"\n❌ Import error: {e}")
     import traceback